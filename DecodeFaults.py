@@ -4,8 +4,185 @@ Created on Fri Oct 11 14:55:16 2024
 
 @author: TBates
 """
+from functools import lru_cache
+
 import automation1 as a1
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Axis fault bits, in bit order: (fault name, bit mask)
+FAULT_BITS = (
+    ('PositionErrorFault', 1 << 0),
+    ('OverCurrentFault', 1 << 1),
+    ('CwEndOfTravelLimitFault', 1 << 2),
+    ('CcwEndOfTravelLimitFault', 1 << 3),
+    ('CwSoftwareLimitFault', 1 << 4),
+    ('CcwSoftwareLimitFault', 1 << 5),
+    ('AmplifierFault', 1 << 6),
+    ('FeedbackInput0Fault', 1 << 7),
+    ('FeedbackInput1Fault', 1 << 8),
+    ('HallSensorFault', 1 << 9),
+    ('MaxVelocityCommandFault', 1 << 10),
+    ('EmergencyStopFault', 1 << 11),
+    ('VelocityErrorFault', 1 << 12),
+    ('ExternalFault', 1 << 15),
+    ('MotorTemperatureFault', 1 << 17),
+    ('AmplifierTemperatureFault', 1 << 18),
+    ('EncoderFault', 1 << 19),
+    ('GantryMisalignmentFault', 1 << 22),
+    ('FeedbackScalingFault', 1 << 23),
+    ('MarkerSearchFault', 1 << 24),
+    ('SafeZoneFault', 1 << 25),
+    ('InPositionTimeoutFault', 1 << 26),
+    ('VoltageClampFault', 1 << 27),
+    ('MotorSupplyFault', 1 << 28),
+    ('InternalFault', 1 << 30),
+)
+FAULT_MASKS = dict(FAULT_BITS)
+FAULT_NAMES = tuple(name for name, _ in FAULT_BITS)
+ALL_FAULTS_MASK = sum(FAULT_MASKS.values())
+
+
+@lru_cache(maxsize=None)
+def _half_word_names(half, shift):
+    '''Fault names for one 16-bit half of a fault word (lookup table filled on first use).'''
+    word = half << shift
+    return tuple(name for name, mask in FAULT_BITS if word & mask)
+
+
+def fault_names(fault_word):
+    '''
+    Fault names set in a fault word, in bit order.
+
+    Uses two 16-bit lookups (low half, high half) instead of testing every bit.
+    '''
+    fault_word = int(fault_word) & ALL_FAULTS_MASK
+    if not fault_word:
+        return ()
+    return _half_word_names(fault_word & 0xFFFF, 0) + _half_word_names(fault_word >> 16, 16)
+
+
+class FaultBits:
+    '''
+    Compact decoded fault state for one axis: the masked fault word,
+    with fault names expanded only when asked for.
+    '''
+    __slots__ = ('axis', 'word')
+
+    def __init__(self, axis, word):
+        self.axis = axis
+        self.word = int(word) & ALL_FAULTS_MASK
+
+    def __bool__(self):
+        return self.word != 0
+
+    def __int__(self):
+        return self.word
+
+    def __contains__(self, fault_name):
+        return bool(self.word & FAULT_MASKS.get(fault_name, 0))
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __eq__(self, other):
+        if isinstance(other, FaultBits):
+            return self.axis == other.axis and self.word == other.word
+        return NotImplemented
+
+    def __repr__(self):
+        return f'FaultBits({self.axis!r}, 0x{self.word:08X})'
+
+    @property
+    def names(self):
+        return fault_names(self.word)
+
+
+class FaultBatch:
+    '''
+    Fault words for many axes decoded in one step.
+
+    words holds the masked fault words (a NumPy uint32 array when NumPy is
+    installed, else a list); names are expanded per axis on demand.
+    '''
+
+    def __init__(self, axes, words):
+        self.axes = list(axes)
+        self.words = words
+
+    def __len__(self):
+        return len(self.axes)
+
+    def __getitem__(self, axis):
+        return FaultBits(axis, self.words[self.axes.index(axis)])
+
+    def __iter__(self):
+        for axis, word in zip(self.axes, self.words):
+            yield FaultBits(axis, word)
+
+    def any(self):
+        '''True if any axis has a fault.'''
+        return any(int(word) for word in self.words)
+
+    def faulted(self):
+        '''FaultBits for only the axes with a fault.'''
+        return [bits for bits in self if bits]
+
+    def to_dict(self):
+        '''{axis: [fault names]} for every axis (empty list when no fault).'''
+        return {axis: list(fault_names(word)) for axis, word in zip(self.axes, self.words)}
+
+    def fault_matrix(self):
+        '''
+        Boolean axes x FAULT_NAMES matrix (NumPy array, or list of lists without NumPy).
+        '''
+        if np is None:
+            return [[bool(int(word) & mask) for _, mask in FAULT_BITS] for word in self.words]
+        masks = np.array([mask for _, mask in FAULT_BITS], dtype=np.uint32)
+        return (np.asarray(self.words, dtype=np.uint32)[:, None] & masks) != 0
+
+    def counts(self):
+        '''{fault name: number of axes with that fault} for faults present on any axis.'''
+        matrix = self.fault_matrix()
+        if isinstance(matrix, list):
+            totals = [sum(column) for column in zip(*matrix)] if matrix else [0] * len(FAULT_NAMES)
+        else:
+            totals = matrix.sum(axis=0).tolist()
+        return {name: int(total) for name, total in zip(FAULT_NAMES, totals) if total}
+
+
+def decode_fault_words(fault_words, axes=None):
+    '''
+    Decode the fault words of many axes at once.
+
+    Parameters
+    ----------
+    fault_words : dict, list or array
+        {axis: fault word}, or a sequence/NumPy array of fault words.
+    axes : list, optional
+        Axis names for a sequence of fault words (default: 0..n-1).
+
+    Returns
+    -------
+    FaultBatch
+        Masked fault words with lazy name expansion.
+
+    '''
+    if isinstance(fault_words, dict):
+        axes = list(fault_words)
+        fault_words = list(fault_words.values())
+    elif axes is None:
+        axes = range(len(fault_words))
+
+    if np is None:
+        return FaultBatch(axes, [int(word) & ALL_FAULTS_MASK for word in fault_words])
+    words = np.asarray(fault_words, dtype=np.int64).astype(np.uint32) & np.uint32(ALL_FAULTS_MASK)
+    return FaultBatch(axes, words)
+
+
 class decode_faults:
     def __init__(self, faults_per_axis, connected_axes, controller: a1.Controller, fault_log):
         '''
@@ -33,43 +210,9 @@ class decode_faults:
         self.fault_log = fault_log
         
     def get_fault(self):
-        fault_dict = {
-            'PositionErrorFault': 1 << 0,
-            'OverCurrentFault': 1 << 1,
-            'CwEndOfTravelLimitFault': 1 << 2,
-            'CcwEndOfTravelLimitFault': 1 << 3,
-            'CwSoftwareLimitFault': 1 << 4,
-            'CcwSoftwareLimitFault': 1 << 5,
-            'AmplifierFault': 1 << 6,
-            'FeedbackInput0Fault': 1 << 7,
-            'FeedbackInput1Fault': 1 << 8,
-            'HallSensorFault': 1 << 9,
-            'MaxVelocityCommandFault': 1 << 10,
-            'EmergencyStopFault': 1 << 11,
-            'VelocityErrorFault': 1 << 12,
-            'ExternalFault': 1 << 15,
-            'MotorTemperatureFault': 1 << 17,
-            'AmplifierTemperatureFault': 1 << 18,
-            'EncoderFault': 1 << 19,
-            'GantryMisalignmentFault': 1 << 22,
-            'FeedbackScalingFault': 1 << 23,
-            'MarkerSearchFault': 1 << 24,
-            'SafeZoneFault': 1 << 25,
-            'InPositionTimeoutFault': 1 << 26,
-            'VoltageClampFault': 1 << 27,
-            'MotorSupplyFault': 1 << 28,
-            'InternalFault': 1 << 30,
-        }
         self.present_faults = []
-        self.decoded_faults_per_axis = {}
-        
-        for axis, axis_faults in self.faults_per_axis.items():
-            present_faults = []
-            for fault_name, fault_enum in fault_dict.items():
-                if axis_faults & fault_enum:  # Check if the fault bit is set
-                    present_faults.append(fault_name)
-            
-            self.decoded_faults_per_axis[axis] = present_faults  # Store decoded faults per axis
+        self.fault_batch = decode_fault_words(self.faults_per_axis)
+        self.decoded_faults_per_axis = self.fault_batch.to_dict()  # Store decoded faults per axis
         
         self.log_faults()
         
@@ -18,25 +18,59 @@ Main Use Cases:
 
 Note: Use variable names like 'mcd_processor' or 'mcd_handler' - avoid 'controller' 
 which is reserved for actual Automation1 controller objects.
+
+The .NET runtime is started lazily on the first McdProcessor.initialize(), so
+importing this module for drive configuration, validation or naming work
+stays pure Python.
 """
-from pythonnet import load
-load("coreclr")
 import os
 import sys
+import csv
+import copy
 import json
+import time
+import bisect
+import hashlib
+import tempfile
+import importlib
+import threading
+import multiprocessing
 from abc import ABC, abstractmethod
-from tkinter import messagebox
-import xml.etree.ElementTree as ET
-
-# Import System for Type.GetType
-import System
-from System.Collections.Generic import List
-from System import String
+from collections import OrderedDict, deque, namedtuple
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from types import MappingProxyType
 
-import clr
+from McdArchive import (McdArchive, McdBundleWriter, DEFAULT_PARAMETER_GROUPS, extract_parameter_groups,
+                        find_mcd_paths, is_version_supported)
 
 sys.dont_write_bytecode = True
 
+# .NET modules, bound by _load_clr() on first McdProcessor.initialize()
+clr = None
+System = None
+List = None
+String = None
+
+def _load_clr():
+    """Start CoreCLR and import the .NET modules used by McdProcessor (once per process)"""
+    global clr, System, List, String
+    if clr is not None:
+        return
+    
+    from pythonnet import load, get_runtime_info
+    if get_runtime_info() is None:
+        load("coreclr")
+    
+    import clr as clr_module
+    # Import System for Type.GetType
+    import System as system_module
+    from System.Collections.Generic import List as list_type
+    from System import String as string_type
+    
+    System, List, String = system_module, list_type, string_type
+    clr = clr_module
+
 # ============================================================================
 # STRATEGY INTERFACES
 # ============================================================================
@@ -125,6 +159,26 @@ class CustomNamingStrategy(NamingStrategy):
         base_name = self.naming_function(file_type, stage_type, context)
         return f"{base_name}{self.extension}"
 
+class SourceFileNamingStrategy(NamingStrategy):
+    """Source file naming: [prefix][source file stem].mcd
+    
+    Uses context['source_path'] (set by recalculate_and_extract) so that
+    recalculating many files doesn't collapse onto one output name.
+    Falls back to default naming when no source path is given.
+    """
+    
+    def __init__(self, prefix="Recalculated_", extension=".mcd"):
+        self.prefix = prefix
+        self.extension = extension
+        self.fallback = DefaultNamingStrategy(extension=extension)
+    
+    def generate_filename(self, file_type, stage_type, context=None):
+        source_path = (context or {}).get('source_path')
+        if source_path:
+            stem = os.path.splitext(os.path.basename(source_path))[0]
+            return f"{self.prefix}{stem}{self.extension}"
+        return self.fallback.generate_filename(file_type, stage_type, context)
+
 # ============================================================================
 # CONCRETE OUTPUT STRATEGIES
 # ============================================================================
@@ -183,15 +237,442 @@ class SpecificDirectoryOutputStrategy(OutputStrategy):
     def should_create_directories(self):
         return self.create_dirs
 
+class BundleOutputStrategy(OutputStrategy):
+    """Output into one bundle file; file types become folders inside the bundle
+    
+    Use with BundleFileManager.
+    """
+    
+    def __init__(self, bundle_path, create_dirs=True):
+        """
+        Args:
+            bundle_path: Bundle file to write (e.g. 'batch.mcdz')
+            create_dirs: Whether to auto-create the bundle's directory
+        """
+        self.bundle_path = bundle_path
+        self.create_dirs = create_dirs
+    
+    def get_output_directory(self, file_type):
+        return file_type  # Folder inside the bundle
+    
+    def should_create_directories(self):
+        return self.create_dirs
+
 
 # ============================================================================
 # DRIVE CONFIGURATION MANAGER
 # ============================================================================
 
+# Per-option validation data compiled from drive_config.json
+#   valid_values: frozenset of choices with the suffix stripped (None = no choices to check)
+#   suggestion: default value with suffix, offered when a choice is invalid
+#   choices_text: comma-separated choices for invalid-choice messages
+CompiledOption = namedtuple('CompiledOption', ['suffix', 'choices', 'valid_values', 'suggestion', 'choices_text'])
+
+# Per-drive validation index: option name -> CompiledOption, plus required option names
+CompiledDrive = namedtuple('CompiledDrive', ['options', 'required'])
+
+# Lower-cased option names that belong in electrical_dict, never in specs_dict
+ELECTRICAL_OPTION_KEYS = frozenset([
+    "bus voltage", "bus_voltage", "bus", 
+    "current", "multiplier", "motor supply voltage",
+    "axes", "expansion board"
+])
+
+# Error codes reported by DriveConfigManager.validate_bulk (option-specific
+# codes are suffixed with ':<option name>')
+ERROR_UNKNOWN_DRIVE_TYPE = "UNKNOWN_DRIVE_TYPE"
+ERROR_INVALID_FORMAT = "INVALID_FORMAT"
+ERROR_MISSING_REQUIRED = "MISSING_REQUIRED"
+ERROR_INVALID_CHOICE = "INVALID_CHOICE"
+ERROR_ELECTRICAL_IN_SPECS = "ELECTRICAL_IN_SPECS"
+
+# One failed per-option check: code is ERROR_MISSING_REQUIRED or ERROR_INVALID_CHOICE
+OptionError = namedtuple('OptionError', ['code', 'option', 'value'])
+
+def read_validation_rows_csv(csv_path):
+    """
+    Stream bulk-validation rows from a CSV file
+    
+    Expected columns: 'drive_type', plus one column per option named
+    'electrical:<option>' or 'specs:<option>'. Empty cells are omitted.
+    
+    Args:
+        csv_path (str): CSV file path
+        
+    Yields:
+        dict: {'drive_type', 'electrical_dict', 'specs_dict'}
+    """
+    with open(csv_path, 'r', newline='', encoding='utf-8-sig') as f:
+        for record in csv.DictReader(f):
+            row = {'drive_type': (record.get('drive_type') or '').strip(), 'electrical_dict': {}, 'specs_dict': {}}
+            for column, value in record.items():
+                if column is None or value is None or value == '':
+                    continue
+                if column.startswith('electrical:'):
+                    row['electrical_dict'][column[len('electrical:'):]] = value
+                elif column.startswith('specs:'):
+                    row['specs_dict'][column[len('specs:'):]] = value
+            yield row
+
+def compile_validation_index(config_data):
+    """
+    Compile drive_config.json data into a per-drive validation index
+    
+    Args:
+        config_data (dict): Parsed drive configuration
+        
+    Returns:
+        dict: drive_type -> CompiledDrive
+    """
+    index = {}
+    for drive_type, drive_config in config_data.get("drive_types", {}).items():
+        options = {}
+        required = []
+        for option_name, config in drive_config.get("electrical_options", {}).items():
+            suffix = config.get("suffix", "")
+            choices = config.get("choices", [])
+            default = config.get("default", "")
+            valid_values = None
+            if choices:
+                valid_values = frozenset(str(choice).replace(suffix, "") if suffix else str(choice) for choice in choices)
+            options[option_name] = CompiledOption(
+                suffix=suffix,
+                choices=choices,
+                valid_values=valid_values,
+                suggestion=default + suffix if default else None,
+                choices_text=', '.join(map(str, choices))
+            )
+            if config.get("required", False):
+                required.append(option_name)
+        index[drive_type] = CompiledDrive(options=options, required=tuple(required))
+    return index
+
+def _validation_results(valid, errors, warnings=None, missing_required=None, invalid_choices=None,
+                        suggestions=None):
+    """Build the result dict returned by DriveConfigManager.validate_electrical_dict"""
+    return {
+        'valid': valid,
+        'errors': errors,
+        'warnings': warnings if warnings is not None else [],
+        'missing_required': missing_required if missing_required is not None else [],
+        'invalid_choices': invalid_choices if invalid_choices is not None else [],
+        'suggestions': suggestions if suggestions is not None else {}
+    }
+
+def find_option_errors(compiled_drive, electrical_dict):
+    """
+    Check an electrical_dict against one drive's required options and choices
+    
+    Shared by validate_electrical_dict and validate_bulk so both report the
+    same failures. Values are compared with the option suffix stripped;
+    options without choices are not checked.
+    
+    Args:
+        compiled_drive (CompiledDrive): Drive entry from the validation index
+        electrical_dict (Mapping): Electrical configuration options
+        
+    Returns:
+        list: OptionError entries - missing required options first, then
+              invalid choices in electrical_dict order
+    """
+    errors = [
+        OptionError(ERROR_MISSING_REQUIRED, option_name, None)
+        for option_name in compiled_drive.required
+        if not electrical_dict.get(option_name)
+    ]
+    options = compiled_drive.options
+    for option_name, value in electrical_dict.items():
+        option = options.get(option_name)
+        if option is None:
+            continue
+        valid_values = option.valid_values
+        if valid_values is None:
+            continue  # Only validate if choices are defined
+        
+        # Clean value for comparison (remove suffix)
+        suffix = option.suffix
+        clean_value = str(value)
+        if suffix and clean_value.endswith(suffix):
+            clean_value = clean_value[:-len(suffix)]
+        
+        if clean_value not in valid_values:
+            errors.append(OptionError(ERROR_INVALID_CHOICE, option_name, value))
+    return errors
+
+# ----------------------------------------------------------------------------
+# Cross-option validation rules (drive_config.json "validation_rules")
+# ----------------------------------------------------------------------------
+
+# Error code prefix reported by validate_bulk for error-severity rule violations
+ERROR_RULE_VIOLATION = "RULE_VIOLATION"
+
+RULE_SEVERITY_ERROR = "error"
+RULE_SEVERITY_WARNING = "warning"
+
+# One failed cross-option check
+RuleViolation = namedtuple('RuleViolation', ['rule', 'severity', 'options', 'message'])
+
+# Rule name in "validation_rules" -> compiler(rule_data, settings) returning a rule object
+VALIDATION_RULE_COMPILERS = {}
+
+def register_validation_rule(rule_name):
+    """
+    Register a compiler for a "validation_rules" entry in drive_config.json
+    
+    The compiler is called as compiler(rule_data, settings) - settings being the
+    rule's "validation_rule_settings" entry ({} if absent) - and must return an
+    object with a check(drive_type, electrical_dict) method yielding RuleViolation.
+    An optional for_drive(compiled_drive) method returns the rule specialized
+    for one drive, or None to skip it for drives lacking the options it checks.
+    
+    Args:
+        rule_name (str): Key under "validation_rules"
+        
+    Returns:
+        callable: Decorator
+    """
+    def decorator(compiler):
+        VALIDATION_RULE_COMPILERS[rule_name] = compiler
+        return compiler
+    return decorator
+
+def parse_option_number(value, suffix=""):
+    """Parse an electrical option value such as '160V' or '-20' (None if not numeric)"""
+    text = str(value).strip()
+    if suffix and text.endswith(suffix):
+        text = text[:-len(suffix)]
+    try:
+        return abs(float(text))
+    except ValueError:
+        return None
+
+class BusVoltageRangeRule:
+    """Allowed current range per bus voltage band
+    
+    Current options hold part-number codes ('-10', '-20', ...). The
+    bus_voltage_ranges table is written on the same scale, so a code is rated
+    at its numeric value unless current_ratings (from the rule's
+    validation_rule_settings) gives an explicit rating for it. Empty or
+    non-numeric codes (e.g. unpopulated axis pairs) are not checked - choice
+    validation already reports unknown codes.
+    """
+    
+    def __init__(self, ranges, current_ratings=None, severity=RULE_SEVERITY_ERROR, voltage_option="Bus Voltage",
+                 current_prefix="Current"):
+        """
+        Args:
+            ranges (dict): Band voltage -> {'min_current', 'max_current'}; a bus
+                voltage falls in the band of the highest listed voltage <= it
+            current_ratings (dict, optional): Current option code -> rating, overriding
+                the code's numeric value
+            severity (str): RULE_SEVERITY_ERROR or RULE_SEVERITY_WARNING
+            voltage_option (str): Electrical option holding the bus voltage
+            current_prefix (str): Electrical options starting with this hold current codes
+        """
+        bands = sorted(
+            (float(voltage), limits.get('min_current'), limits.get('max_current'))
+            for voltage, limits in ranges.items()
+        )
+        self.voltages = [band[0] for band in bands]
+        self.limits = [(band[1], band[2]) for band in bands]
+        self.current_ratings = {str(code).strip(): float(amps) for code, amps in (current_ratings or {}).items()}
+        self.severity = severity
+        self.voltage_option = voltage_option
+        self.current_prefix = current_prefix
+        self.current_options = None  # Set by for_drive; None scans electrical_dict by prefix
+    
+    def lookup(self, bus_voltage):
+        """
+        Find the band for a bus voltage
+        
+        Returns:
+            tuple or None: (band_voltage, min_current, max_current), None below the lowest band
+        """
+        index = bisect.bisect_right(self.voltages, bus_voltage) - 1
+        if index < 0:
+            return None
+        return (self.voltages[index],) + self.limits[index]
+    
+    def for_drive(self, compiled_drive):
+        """
+        Bind the rule to a drive's current options
+        
+        Returns:
+            BusVoltageRangeRule or None: None if the drive has no bus voltage
+                or no current option
+        """
+        options = compiled_drive.options
+        current_options = tuple(name for name in options if name.startswith(self.current_prefix))
+        if self.voltage_option not in options or not current_options:
+            return None
+        bound = copy.copy(self)
+        bound.current_options = current_options
+        return bound
+    
+    def check(self, drive_type, electrical_dict):
+        bus_voltage = parse_option_number(electrical_dict.get(self.voltage_option, ""), "V")
+        if bus_voltage is None:
+            return
+        band = self.lookup(bus_voltage)
+        if band is None:
+            return
+        band_voltage, min_current, max_current = band
+        
+        current_options = self.current_options
+        if current_options is None:
+            current_options = [name for name in electrical_dict if name.startswith(self.current_prefix)]
+        for option_name in current_options:
+            value = electrical_dict.get(option_name)
+            if value is None:
+                continue
+            code = str(value).strip()
+            current = self.current_ratings.get(code)
+            if current is None:
+                current = parse_option_number(code)
+            if current is None:
+                continue  # Unpopulated axis pair or non-numeric code
+            if (min_current is not None and current < min_current) or \
+               (max_current is not None and current > max_current):
+                yield RuleViolation(
+                    rule="bus_voltage_ranges",
+                    severity=self.severity,
+                    options=(self.voltage_option, option_name),
+                    message=(f"{option_name} {value} ({current:g} A) is outside {min_current}-{max_current} A "
+                             f"allowed at {bus_voltage:g} V bus (band {band_voltage:g} V)")
+                )
+
+@register_validation_rule("bus_voltage_ranges")
+def _compile_bus_voltage_ranges(rule_data, settings):
+    return BusVoltageRangeRule(
+        rule_data,
+        settings.get("current_ratings"),
+        settings.get("severity", RULE_SEVERITY_ERROR)
+    )
+
+def compile_validation_rules(config_data):
+    """
+    Compile drive_config.json "validation_rules" into rule objects
+    
+    Each rule's "validation_rule_settings" entry is passed to its compiler
+    (severity defaults to error). Rules without a registered compiler are
+    reported and skipped.
+    
+    Args:
+        config_data (dict): Parsed drive configuration
+        
+    Returns:
+        list: Compiled rule objects
+    """
+    settings = config_data.get("validation_rule_settings", {})
+    rules = []
+    for rule_name, rule_data in config_data.get("validation_rules", {}).items():
+        compiler = VALIDATION_RULE_COMPILERS.get(rule_name)
+        if compiler is None:
+            print(f"Warning: No compiler registered for validation rule '{rule_name}' - skipped")
+            continue
+        rules.append(compiler(rule_data, settings.get(rule_name, {})))
+    return rules
+
+def index_rules_by_drive(validation_index, rules):
+    """
+    Select (and specialize) the compiled rules that apply to each drive type
+    
+    Args:
+        validation_index (dict): drive_type -> CompiledDrive
+        rules (tuple): Compiled rule objects
+        
+    Returns:
+        dict: drive_type -> tuple of rules (empty when nothing applies)
+    """
+    drive_rules = {}
+    for drive_type, compiled_drive in validation_index.items():
+        bound = []
+        for rule in rules:
+            if hasattr(rule, 'for_drive'):
+                rule = rule.for_drive(compiled_drive)
+            if rule is not None:
+                bound.append(rule)
+        drive_rules[drive_type] = tuple(bound)
+    return drive_rules
+
+def _freeze_json(value):
+    """Read-only view of parsed JSON data (dicts -> MappingProxyType, lists -> tuples)"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze_json(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze_json(item) for item in value)
+    return value
+
+def _thaw_json(value):
+    """Editable copy of a _freeze_json view (mappings -> dict, tuples -> list)"""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw_json(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw_json(item) for item in value]
+    return value
+
+def _file_signature(path):
+    """(mtime_ns, size) of a file, or None if it can't be stat'ed"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+# One parsed and indexed version of drive_config.json. Snapshots are never
+# modified after being published (the memo dicts only gain entries), so a job
+# holding one keeps a consistent view while a newer version is swapped in.
+# drive_rules holds the subset of validation_rules that applies to each drive.
+DriveConfigSnapshot = namedtuple('DriveConfigSnapshot', [
+    'version', 'signature', 'config_data', 'validation_index', 'validation_rules',
+    'drive_rules', 'menu_memo', 'defaults_memo'
+])
+
+class PollingWatcher:
+    """Daemon thread calling change-check functions at a fixed interval"""
+    
+    def __init__(self, checks, interval=2.0, name="ConfigWatcher"):
+        """
+        Args:
+            checks (list): Callables polled in order (exceptions are reported, not raised)
+            interval (float): Seconds between polls
+            name (str): Thread name
+        """
+        self.checks = list(checks)
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+    
+    def start(self):
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """Stop polling and wait for the thread to exit"""
+        self._stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join()
+    
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            for check in self.checks:
+                try:
+                    check()
+                except Exception as e:
+                    print(f"⚠️ Hot reload check failed: {e}")
+
 class DriveConfigManager:
     """Manages drive configuration data and provides validation/UI support"""
     
-    def __init__(self, config_file_path=None, base_dir=None):
+    def __init__(self, config_file_path=None, base_dir=None, template_index=None):
+        """
+        Args:
+            config_file_path (str, optional): drive_config.json path
+            base_dir (str, optional): Directory holding GenerateMCD_Assets
+            template_index (TemplateDirectoryIndex, optional): Shared template
+                directory index (built on first template lookup if omitted)
+        """
         if base_dir is None:
             base_dir = os.path.dirname(os.path.abspath(__file__))
         
@@ -200,18 +681,152 @@ class DriveConfigManager:
         
         self.config_file_path = config_file_path
         self.base_dir = base_dir
-        self.config_data = self._load_config()
+        self._template_index = template_index
+        self._reload_lock = threading.Lock()
+        self._memo_lock = threading.Lock()
+        self._snapshot = None
+        self._rejected_signature = None
+        self._watcher = None
+        self.reload_config()
+    
+    # ========================================================================
+    # SNAPSHOTS & HOT RELOAD
+    # ========================================================================
+    
+    @property
+    def snapshot(self):
+        """Current DriveConfigSnapshot - hold on to it for a consistent view during a job"""
+        return self._snapshot
+    
+    @property
+    def config_version(self):
+        """Version of the current snapshot (1 at construction, +1 per reload)"""
+        return self._snapshot.version
+    
+    @property
+    def config_data(self):
+        return self._snapshot.config_data
+    
+    @property
+    def template_index(self):
+        """TemplateDirectoryIndex for GenerateMCD_Assets"""
+        if self._template_index is None:
+            self._template_index = TemplateDirectoryIndex(os.path.join(self.base_dir, "GenerateMCD_Assets"))
+        return self._template_index
+    
+    @property
+    def validation_index(self):
+        return self._snapshot.validation_index
+    
+    @property
+    def validation_rules(self):
+        return self._snapshot.validation_rules
+    
+    def reload_config(self, strict=False):
+        """
+        Parse and index drive_config.json, then atomically swap in the new snapshot
+        
+        Args:
+            strict (bool): Raise on a missing/unparsable file instead of
+                falling back to an empty configuration. Drive defaults that
+                violate validation_rules are reported (see
+                check_default_configs), never rejected.
+                
+        Returns:
+            DriveConfigSnapshot: The published snapshot
+        """
+        with self._reload_lock:
+            return self._reload_locked(_file_signature(self.config_file_path), strict)
+    
+    def _reload_locked(self, signature, strict):
+        """Build and publish a snapshot (caller holds _reload_lock)"""
+        config_data = self._load_config(strict)
+        validation_index = compile_validation_index(config_data)
+        validation_rules = tuple(compile_validation_rules(config_data))
+        snapshot = DriveConfigSnapshot(
+            version=self._snapshot.version + 1 if self._snapshot else 1,
+            signature=signature,
+            config_data=config_data,
+            validation_index=validation_index,
+            validation_rules=validation_rules,
+            drive_rules=index_rules_by_drive(validation_index, validation_rules),
+            menu_memo={},
+            defaults_memo={}
+        )
+        for drive_type, violations in self.check_default_configs(snapshot).items():
+            print(f"⚠️ {drive_type} default configuration conflicts with validation_rules: "
+                  + "; ".join(violation.message for violation in violations))
+        self._snapshot = snapshot
+        self._rejected_signature = None
+        return snapshot
+    
+    def refresh_if_changed(self):
+        """
+        Reload if drive_config.json changed on disk since the current snapshot
+        
+        A file that fails to parse (e.g. caught mid-save) is reported once and
+        the current snapshot stays in service until the file changes again.
+        The signature check and the swap happen under the reload lock, so
+        concurrent callers see one reload per change.
+        
+        Returns:
+            bool: True if a new snapshot was published
+        """
+        with self._reload_lock:
+            signature = _file_signature(self.config_file_path)
+            if signature == self._snapshot.signature or signature == self._rejected_signature:
+                return False
+            try:
+                snapshot = self._reload_locked(signature, strict=True)
+            except (OSError, ValueError) as e:
+                self._rejected_signature = signature
+                print(f"⚠️ Keeping drive config v{self.config_version}: reload failed ({e})")
+                return False
+        print(f"🔄 Drive config reloaded (v{snapshot.version}, {len(snapshot.validation_index)} drive types)")
+        return True
+    
+    def start_watching(self, interval=2.0):
+        """Poll drive_config.json in a background thread and hot-reload on change"""
+        if self._watcher is None:
+            self._watcher = PollingWatcher([self.refresh_if_changed], interval, "DriveConfigWatcher").start()
+    
+    def stop_watching(self):
+        """Stop the background poll started by start_watching"""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+    
+    def _memoized(self, memo_name, drive_type, build, snapshot=None):
+        """
+        Get a read-only per-drive structure, building it on first use
+        
+        Reads only the given (default: current) snapshot and never touches the
+        filesystem; a changed drive_config.json is picked up by start_watching()
+        or an explicit reload_config()/refresh_if_changed() call.
+        """
+        snapshot = snapshot or self._snapshot
+        memo = getattr(snapshot, memo_name)
+        with self._memo_lock:
+            if drive_type in memo:
+                return memo[drive_type]
+        drive_config = snapshot.config_data.get("drive_types", {}).get(drive_type)
+        value = _freeze_json(build(drive_type, drive_config))
+        with self._memo_lock:
+            return memo.setdefault(drive_type, value)
     
-    def _load_config(self):
+    def _load_config(self, strict=False):
         """Load drive configuration from JSON file"""
         try:
-            import json
             with open(self.config_file_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except FileNotFoundError:
+            if strict:
+                raise
             print(f"Warning: Drive config file not found at {self.config_file_path}")
             return {"drive_types": {}}
         except json.JSONDecodeError as e:
+            if strict:
+                raise
             print(f"Error parsing drive config: {e}")
             return {"drive_types": {}}
     
@@ -253,9 +868,9 @@ class DriveConfigManager:
         """Get list of all configured drive types"""
         return list(self.config_data.get("drive_types", {}).keys())
     
-    def get_drive_config(self, drive_type):
-        """Get complete configuration for a drive type"""
-        return self.config_data.get("drive_types", {}).get(drive_type)
+    def get_drive_config(self, drive_type, snapshot=None):
+        """Get complete configuration for a drive type (current snapshot by default)"""
+        return (snapshot or self._snapshot).config_data.get("drive_types", {}).get(drive_type)
     
     def get_electrical_options(self, drive_type):
         """Get electrical options for a specific drive type"""
@@ -271,8 +886,26 @@ class DriveConfigManager:
         return option_config.get("choices", [])
     
     def get_default_electrical_dict(self, drive_type):
+        """
+        Get the default electrical_dict for a drive type
+        
+        Returns:
+            dict: Fresh copy of the cached defaults (safe to edit)
+        """
+        return dict(self.get_default_electrical_view(drive_type))
+    
+    def get_default_electrical_view(self, drive_type):
+        """
+        Get the cached default electrical_dict without copying it
+        
+        Returns:
+            Mapping: Read-only view shared between callers
+        """
+        return self._memoized('defaults_memo', drive_type, self._build_default_electrical_dict)
+    
+    def _build_default_electrical_dict(self, drive_type, drive_config):
         """Generate default electrical_dict for a drive type"""
-        electrical_options = self.get_electrical_options(drive_type)
+        electrical_options = (drive_config or {}).get("electrical_options", {})
         defaults = {}
         
         for option_name, config in electrical_options.items():
@@ -287,76 +920,243 @@ class DriveConfigManager:
         
         return defaults
     
-    def validate_electrical_dict(self, drive_type, electrical_dict):
-        """Validate electrical_dict against drive configuration"""
-        results = {
-            'valid': True,
-            'errors': [],
-            'warnings': [],
-            'missing_required': [],
-            'invalid_choices': [],
-            'suggestions': {}
-        }
+    def validate_electrical_dict(self, drive_type, electrical_dict, snapshot=None):
+        """Validate electrical_dict against drive configuration (current snapshot by default)"""
+        snapshot = snapshot or self._snapshot
+        compiled_drive = snapshot.validation_index.get(drive_type)
+        if not compiled_drive:
+            return _validation_results(False, [f"Unknown drive type: {drive_type}"])
+        
+        if not isinstance(electrical_dict, Mapping):
+            return _validation_results(
+                False, [f"electrical_dict must be a dictionary, got {type(electrical_dict).__name__}"]
+            )
         
-        drive_config = self.get_drive_config(drive_type)
-        if not drive_config:
-            results['valid'] = False
-            results['errors'].append(f"Unknown drive type: {drive_type}")
-            return results
+        # Check for missing required options and invalid choices
+        option_errors = find_option_errors(compiled_drive, electrical_dict)
+        drive_rules = snapshot.drive_rules.get(drive_type, ())
+        if not option_errors and not drive_rules:
+            return _validation_results(True, [])
+        
+        valid = not option_errors
+        errors = []
+        warnings = []
+        missing_required = []
+        invalid_choices = []
+        suggestions = {}
+        options = compiled_drive.options
+        for error in option_errors:
+            if error.code == ERROR_MISSING_REQUIRED:
+                missing_required.append(error.option)
+                continue
+            
+            option = options[error.option]
+            invalid_choices.append({
+                'option': error.option,
+                'value': error.value,
+                'valid_choices': option.choices
+            })
+            
+            # Suggest default
+            if option.suggestion:
+                suggestions[error.option] = option.suggestion
         
-        electrical_options = drive_config.get("electrical_options", {})
+        # Compile error messages
+        if missing_required:
+            errors.append(f"Missing required options: {', '.join(missing_required)}")
         
-        # Check for missing required options
-        for option_name, config in electrical_options.items():
-            if config.get("required", False):
-                if option_name not in electrical_dict or not electrical_dict[option_name]:
-                    results['missing_required'].append(option_name)
-                    results['valid'] = False
+        for invalid in invalid_choices:
+            errors.append(
+                f"Invalid value '{invalid['value']}' for {invalid['option']}. "
+                f"Valid choices: {options[invalid['option']].choices_text}"
+            )
+        
+        # Cross-option rules (e.g. bus voltage vs. current ranges), if any apply to this drive
+        for rule in drive_rules:
+            for violation in rule.check(drive_type, electrical_dict):
+                if violation.severity == RULE_SEVERITY_ERROR:
+                    errors.append(violation.message)
+                    valid = False
+                else:
+                    warnings.append(violation.message)
+        
+        return _validation_results(valid, errors, warnings, missing_required, invalid_choices, suggestions)
+    
+    def check_validation_rules(self, drive_type, electrical_dict, snapshot=None):
+        """
+        Apply the compiled "validation_rules" to an electrical_dict
+        
+        Args:
+            drive_type (str): Drive model name
+            electrical_dict (dict): Electrical configuration options
+            snapshot (DriveConfigSnapshot, optional): Config version to check
+                against (default: current)
+            
+        Returns:
+            list: RuleViolation entries (empty if every rule passes)
+        """
+        snapshot = snapshot or self._snapshot
+        rules = snapshot.drive_rules.get(drive_type)
+        if rules is None:
+            rules = snapshot.validation_rules  # Unknown drive: no option index to filter by
+        violations = []
+        for rule in rules:
+            violations.extend(rule.check(drive_type, electrical_dict))
+        return violations
+    
+    def check_default_configs(self, snapshot=None):
+        """
+        Check every drive's default electrical_dict against the validation rules
+        
+        Conflicts are data issues for the drive data owners (defaults vs. the
+        rule table); they are reported on every reload so they stay visible.
+        
+        Args:
+            snapshot (DriveConfigSnapshot, optional): Config version to check (default: current)
+            
+        Returns:
+            dict: {drive_type: [RuleViolation]} for drives whose defaults fail (empty if all pass)
+        """
+        snapshot = snapshot or self._snapshot
+        rejected = {}
+        for drive_type, drive_config in snapshot.config_data.get("drive_types", {}).items():
+            defaults = self._build_default_electrical_dict(drive_type, drive_config)
+            violations = self.check_validation_rules(drive_type, defaults, snapshot)
+            if violations:
+                rejected[drive_type] = violations
+        return rejected
+    
+    def validate_bulk(self, rows, chunk_size=1000):
+        """
+        Validate many axis configurations and return one columnar result
         
-        # Check for invalid choices
-        for option_name, value in electrical_dict.items():
-            if option_name in electrical_options:
-                config = electrical_options[option_name]
-                choices = config.get("choices", [])
+        Args:
+            rows (iterable): Dicts with 'drive_type', 'electrical_dict' and
+                optional 'specs_dict' (e.g. from read_validation_rows_csv)
+            chunk_size (int): Rows validated per group-by-drive pass
+            
+        Returns:
+            dict: Columns of equal length - 'row', 'drive_type', 'valid',
+                  'error_codes' (list per row) and 'suggestions' (dict per row)
+        """
+        columns = {'row': [], 'drive_type': [], 'valid': [], 'error_codes': [], 'suggestions': []}
+        for chunk in self.iter_validate_bulk(rows, chunk_size):
+            for name, values in chunk.items():
+                columns[name].extend(values)
+        return columns
+    
+    def iter_validate_bulk(self, rows, chunk_size=1000):
+        """
+        Stream columnar validation results chunk by chunk for very large inputs
+        
+        Rows are read lazily, grouped by drive type within each chunk and
+        checked against the compiled validation index. Error codes use the
+        ERROR_* constants, suffixed with ':<option>' where an option is involved.
+        
+        Args:
+            rows (iterable): Same as validate_bulk
+            chunk_size (int): Rows per yielded chunk
+            
+        Yields:
+            dict: Columnar chunk with the same columns as validate_bulk, in input order
+        """
+        chunk = []
+        start = 0
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield self._validate_bulk_chunk(start, chunk)
+                start += len(chunk)
+                chunk = []
+        if chunk:
+            yield self._validate_bulk_chunk(start, chunk)
+    
+    def _validate_bulk_chunk(self, start, chunk):
+        """Validate one chunk of rows grouped by drive type"""
+        snapshot = self._snapshot
+        count = len(chunk)
+        valid = [True] * count
+        error_codes = [[] for _ in range(count)]
+        suggestions = [{} for _ in range(count)]
+        drive_types = [row.get('drive_type') if isinstance(row, Mapping) else None for row in chunk]
+        
+        by_drive = {}
+        for offset, drive_type in enumerate(drive_types):
+            by_drive.setdefault(drive_type, []).append(offset)
+        
+        for drive_type, offsets in by_drive.items():
+            compiled_drive = snapshot.validation_index.get(drive_type)
+            for offset in offsets:
+                row = chunk[offset]
+                codes = error_codes[offset]
+                if not isinstance(row, Mapping):
+                    codes.append(ERROR_INVALID_FORMAT)
+                    valid[offset] = False
+                    continue
                 
-                if choices:  # Only validate if choices are defined
-                    # Clean value for comparison (remove suffix)
-                    clean_value = str(value)
-                    suffix = config.get("suffix", "")
-                    if suffix and clean_value.endswith(suffix):
-                        clean_value = clean_value[:-len(suffix)]
+                electrical_dict = row.get('electrical_dict') or {}
+                specs_dict = row.get('specs_dict') or {}
+                if not isinstance(electrical_dict, Mapping) or not isinstance(specs_dict, Mapping):
+                    codes.append(ERROR_INVALID_FORMAT)
+                    valid[offset] = False
+                    continue
+                
+                for key in specs_dict:
+                    if isinstance(key, str) and key.lower() in ELECTRICAL_OPTION_KEYS:
+                        codes.append(f"{ERROR_ELECTRICAL_IN_SPECS}:{key}")
+                
+                if compiled_drive is None:
+                    codes.append(ERROR_UNKNOWN_DRIVE_TYPE)
+                else:
+                    for error in find_option_errors(compiled_drive, electrical_dict):
+                        codes.append(f"{error.code}:{error.option}")
+                        if error.code == ERROR_INVALID_CHOICE:
+                            suggestion = compiled_drive.options[error.option].suggestion
+                            if suggestion:
+                                suggestions[offset][error.option] = suggestion
                     
-                    # Check if clean value is in choices
-                    valid_choices = [choice.replace(suffix, "") if suffix in str(choice) else str(choice) for choice in choices]
-                    if clean_value not in valid_choices:
-                        results['invalid_choices'].append({
-                            'option': option_name,
-                            'value': value,
-                            'valid_choices': choices
-                        })
-                        results['valid'] = False
-                        
-                        # Suggest default
-                        default = config.get("default", "")
-                        if default:
-                            results['suggestions'][option_name] = default + config.get("suffix", "")
+                    for violation in self.check_validation_rules(drive_type, electrical_dict, snapshot):
+                        if violation.severity == RULE_SEVERITY_ERROR:
+                            codes.append(f"{ERROR_RULE_VIOLATION}:{violation.rule}")
+                
+                if codes:
+                    valid[offset] = False
         
-        # Compile error messages
-        if results['missing_required']:
-            results['errors'].append(f"Missing required options: {', '.join(results['missing_required'])}")
-        
-        if results['invalid_choices']:
-            for invalid in results['invalid_choices']:
-                results['errors'].append(
-                    f"Invalid value '{invalid['value']}' for {invalid['option']}. "
-                    f"Valid choices: {', '.join(map(str, invalid['valid_choices']))}"
-                )
+        return {
+            'row': list(range(start, start + count)),
+            'drive_type': drive_types,
+            'valid': valid,
+            'error_codes': error_codes,
+            'suggestions': suggestions
+        }
+    
+    def generate_ui_menu_data(self, drive_type, snapshot=None):
+        """
+        Get the data structure for UI menu creation
         
-        return results
+        Args:
+            snapshot (DriveConfigSnapshot, optional): Config version (default: current)
+        
+        Returns:
+            dict: Fresh copy of the cached menu data (safe to edit or serialize)
+        """
+        return _thaw_json(self.get_ui_menu_data_view(drive_type, snapshot))
     
-    def generate_ui_menu_data(self, drive_type):
+    def get_ui_menu_data_view(self, drive_type, snapshot=None):
+        """
+        Get the cached UI menu data without copying it
+        
+        Args:
+            snapshot (DriveConfigSnapshot, optional): Config version (default: current)
+        
+        Returns:
+            Mapping: Read-only view shared between callers ('options' and each
+                     option's 'choices' are tuples)
+        """
+        return self._memoized('menu_memo', drive_type, self._build_ui_menu_data, snapshot)
+    
+    def _build_ui_menu_data(self, drive_type, drive_config):
         """Generate data structure for UI menu creation"""
-        drive_config = self.get_drive_config(drive_type)
         if not drive_config:
             return {}
         
@@ -393,7 +1193,7 @@ class DriveConfigManager:
             return None
             
         template_file = config.get('template_file', f"{drive_type}_Template.json")
-        template_path = os.path.join(self.base_dir, "GenerateMCD_Assets", template_file)
+        template_path = self.template_index.path(template_file)
         
         return {
             'type': drive_type,
@@ -403,13 +1203,336 @@ class DriveConfigManager:
             'controller_type': config.get('controller_type', 'Unknown'),
             'max_axes': config.get('max_axes', 1),
             'template_file': template_file,
-            'template_exists': os.path.exists(template_path),
-            'template_path': template_path if os.path.exists(template_path) else None,
+            'template_exists': template_path is not None,
+            'template_path': template_path,
             'electrical_options_count': len(config.get('electrical_options', {})),
             'required_options_count': sum(1 for opt in config.get('electrical_options', {}).values() if opt.get('required', False))
         }
 
 
+# ============================================================================
+# TEMPLATE CACHE
+# ============================================================================
+
+def _copy_json(value):
+    """Structural copy of parsed JSON data (dicts, lists and immutable scalars)"""
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+class TemplateCache:
+    """
+    Cache of parsed drive templates keyed by drive type.
+    
+    Each entry is invalidated when the template file's mtime or size changes,
+    so a batch of conversions for the same drive reads the file once. Callers
+    always receive their own structural copy and may mutate it freely.
+    """
+    
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, drive_type, template_path):
+        """
+        Get a private copy of the parsed template
+        
+        Args:
+            drive_type (str or None): Cache key (None for the default template)
+            template_path (str): Path to the template JSON file
+            
+        Returns:
+            dict: Parsed template data (safe to modify)
+            
+        Raises:
+            FileNotFoundError: If the template file doesn't exist
+        """
+        stat = os.stat(template_path)
+        signature = (template_path, stat.st_mtime_ns, stat.st_size)
+        
+        with self._lock:
+            entry = self._entries.get(drive_type)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                data = entry[1]
+            else:
+                self.misses += 1
+                with open(template_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self._entries[drive_type] = (signature, data)
+        
+        return _copy_json(data)
+    
+    def invalidate(self, drive_type=None):
+        """Drop one cached template, or all of them when drive_type is None"""
+        with self._lock:
+            if drive_type is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(drive_type, None)
+    
+    def stats(self):
+        """Get cache hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'cached_templates': len(self._entries)
+            }
+
+class TemplateDirectoryIndex:
+    """
+    In-memory listing of the drive template directory.
+    
+    The directory is read with a single os.scandir; drive type listings and
+    template existence checks are then answered from memory until refresh()
+    is called (the hot-reload poll does this). Keeps network-mounted asset
+    shares off the per-call path.
+    """
+    
+    TEMPLATE_SUFFIX = "_Template.json"
+    EXCLUDED_TEMPLATES = ("MS_Template.json",)
+    
+    def __init__(self, template_dir):
+        self.template_dir = template_dir
+        self._lock = threading.Lock()
+        self._files = {}
+        self._names = {}
+        self._drive_types = ()
+        self.refresh()
+    
+    def refresh(self):
+        """
+        Rescan the directory
+        
+        Returns:
+            bool: True if any file was added, removed or modified
+        """
+        files = {}
+        try:
+            with os.scandir(self.template_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        files[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Warning: Could not scan template directory {self.template_dir}: {e}")
+        
+        drive_types = tuple(sorted(
+            name[:-len(self.TEMPLATE_SUFFIX)] for name in files
+            if name.endswith(self.TEMPLATE_SUFFIX) and name not in self.EXCLUDED_TEMPLATES
+        ))
+        with self._lock:
+            changed = files != self._files
+            self._files = files
+            # normcase keeps lookups case-insensitive where the filesystem is
+            self._names = {os.path.normcase(name): name for name in files}
+            self._drive_types = drive_types
+        return changed
+    
+    def exists(self, filename):
+        """Check whether a file is present in the directory (as of the last scan)"""
+        return os.path.normcase(filename) in self._names
+    
+    def path(self, filename):
+        """Full path of a file in the directory, or None if it isn't present"""
+        name = self._names.get(os.path.normcase(filename))
+        return os.path.join(self.template_dir, name) if name else None
+    
+    def drive_types(self):
+        """Drive types with a template, sorted alphabetically"""
+        return list(self._drive_types)
+    
+    def template_signatures(self):
+        """Map drive type -> (mtime_ns, size) of its template"""
+        with self._lock:
+            files = self._files
+            drive_types = self._drive_types
+        return {drive_type: files[drive_type + self.TEMPLATE_SUFFIX] for drive_type in drive_types}
+
+
+# ============================================================================
+# CALCULATION RESULT CACHE
+# ============================================================================
+
+class CalculationCache:
+    """
+    On-disk, content-addressed cache of calculated MCD files.
+    
+    Machine Setup calculation is deterministic for a given populated template
+    and Automation1 version, so the key is a hash of the normalized template
+    JSON plus the version. Entries are evicted least-recently-used once the
+    stored MCDs exceed max_bytes. Intended for one process at a time.
+    Lookups only mark the index dirty; flush() persists their recency
+    (AerotechController flushes after each calculation and batch).
+    """
+    
+    INDEX_FILENAME = "index.json"
+    
+    def __init__(self, cache_dir, max_bytes=512 * 1024 * 1024):
+        """
+        Args:
+            cache_dir (str): Directory holding <key>.mcd files and the index
+            max_bytes (int): Size bound for stored MCD files
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(cache_dir, self.INDEX_FILENAME)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+        
+        os.makedirs(cache_dir, exist_ok=True)
+        self._index = self._load_index()
+    
+    @staticmethod
+    def make_key(template_data, automation1_version):
+        """
+        Build the cache key for a populated template
+        
+        Args:
+            template_data (dict): Populated Machine Setup template
+            automation1_version (str): Automation1 version (or DLL path) used to calculate
+            
+        Returns:
+            str: Hex SHA-256 digest
+        """
+        normalized = json.dumps(template_data, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return hashlib.sha256(f"{automation1_version}\n{normalized}".encode('utf-8')).hexdigest()
+    
+    def entry_path(self, key):
+        """Path of the stored MCD for a key"""
+        return os.path.join(self.cache_dir, f"{key}.mcd")
+    
+    def lookup(self, key):
+        """
+        Look up a calculated MCD without reading it
+        
+        Returns:
+            tuple or None: (mcd_path, warnings) on hit, None on miss
+        """
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None or not os.path.exists(self.entry_path(key)):
+                if entry is not None:
+                    # File removed behind our back - forget the entry
+                    self._index.pop(key)
+                    self._dirty = True
+                self.misses += 1
+                return None
+            self._index.move_to_end(key)
+            self._dirty = True
+            self.hits += 1
+            return self.entry_path(key), list(entry['warnings'])
+    
+    def get(self, key):
+        """
+        Get stored calculated MCD bytes
+        
+        Returns:
+            tuple or None: (mcd_bytes, warnings) on hit, None on miss
+        """
+        found = self.lookup(key)
+        if found is None:
+            return None
+        mcd_path, warnings = found
+        with open(mcd_path, 'rb') as f:
+            return f.read(), warnings
+    
+    def put(self, key, calculated_mcd, warnings):
+        """Store a calculated .NET MCD object"""
+        self._store(key, warnings, lambda temp_path: calculated_mcd.WriteToFile(temp_path))
+    
+    def put_bytes(self, key, mcd_bytes, warnings):
+        """Store calculated MCD bytes"""
+        def write(temp_path):
+            with open(temp_path, 'wb') as f:
+                f.write(mcd_bytes)
+        self._store(key, warnings, write)
+    
+    def _store(self, key, warnings, write_func):
+        """Write to a temp file, move into place, then evict down to max_bytes"""
+        final_path = self.entry_path(key)
+        temp_path = os.path.join(self.cache_dir, f"{key}.{os.getpid()}.{threading.get_ident()}.tmp.mcd")
+        write_func(temp_path)
+        os.replace(temp_path, final_path)
+        
+        with self._lock:
+            self._index[key] = {'size': os.path.getsize(final_path), 'warnings': list(warnings)}
+            self._index.move_to_end(key)
+            self._evict()
+            self._save_index()
+    
+    def _evict(self):
+        """Drop least recently used entries until under the size bound (lock held)"""
+        total = sum(entry['size'] for entry in self._index.values())
+        while total > self.max_bytes and len(self._index) > 1:
+            old_key, old_entry = self._index.popitem(last=False)
+            total -= old_entry['size']
+            self.evictions += 1
+            try:
+                os.remove(self.entry_path(old_key))
+            except FileNotFoundError:
+                pass
+    
+    def _load_index(self):
+        """Load the LRU index (oldest first); unreadable index starts empty"""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return OrderedDict(json.load(f))
+        except (FileNotFoundError, ValueError):
+            return OrderedDict()
+    
+    def _save_index(self):
+        """Persist the index atomically (lock held)"""
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f)
+        os.replace(temp_path, self.index_path)
+        self._dirty = False
+    
+    def flush(self):
+        """Persist recency updates from lookups"""
+        with self._lock:
+            if self._dirty:
+                self._save_index()
+    
+    def clear(self):
+        """Remove every cached entry"""
+        with self._lock:
+            for key in list(self._index):
+                try:
+                    os.remove(self.entry_path(key))
+                except FileNotFoundError:
+                    pass
+            self._index.clear()
+            self._save_index()
+    
+    def stats(self):
+        """Get hit/miss/eviction counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': len(self._index),
+                'size_bytes': sum(entry['size'] for entry in self._index.values()),
+                'max_bytes': self.max_bytes
+            }
+
+
 # ============================================================================
 # CORE MCD PROCESSOR
 # ============================================================================
@@ -420,18 +1543,33 @@ class McdProcessor:
     Focused solely on MCD conversion, calculation, and parameter extraction.
     """
     
-    def __init__(self, dll_path=None, drive_config_path=None):
-        """Initialize with optional custom DLL path and drive config path"""
+    def __init__(self, dll_path=None, drive_config_path=None, save_debug_templates=False):
+        """Initialize with optional custom DLL path and drive config path
+        
+        Args:
+            dll_path: Custom Automation1 DLL directory (default: latest installed)
+            drive_config_path: Custom drive_config.json path
+            save_debug_templates: Write each populated template to a
+                DEBUG_populated_template_*.json file for troubleshooting
+        """
         self.base_dir = os.path.dirname(os.path.abspath(__file__))
         self._setup_dll_paths(dll_path)
         self._init_net_objects()
         self.initialized = False
+        self.save_debug_templates = save_debug_templates
         
         # Template directory for drive-specific templates
         self.template_dir = os.path.join(self.base_dir, "GenerateMCD_Assets")
+        self.template_index = TemplateDirectoryIndex(self.template_dir)
+        self.template_cache = TemplateCache()
+        self.template_version = 1
+        self._hot_reload_watcher = None
+        
+        # Parameter groups pulled out of the Parameters XML (see register_parameter_group)
+        self.parameter_groups = dict(DEFAULT_PARAMETER_GROUPS)
         
         # Initialize drive configuration manager
-        self.drive_config_manager = DriveConfigManager(drive_config_path, self.base_dir)
+        self.drive_config_manager = DriveConfigManager(drive_config_path, self.base_dir, self.template_index)
     
     def _setup_dll_paths(self, custom_dll_path):
         """Setup paths to required DLLs"""
@@ -473,6 +1611,7 @@ class McdProcessor:
         if not latest_version:
             message = "Automation1 2.11 or newer required. Please install."
             try:
+                from tkinter import messagebox
                 messagebox.showwarning("Automation1 Not Found", message)
             except Exception:
                 print("Warning: " + message)
@@ -483,11 +1622,39 @@ class McdProcessor:
             raise FileNotFoundError(f"Aerotech DLL path not found: {dll_path}")
         return dll_path
     
+    def get_automation1_version(self):
+        """
+        Get the Automation1 version the DLLs are loaded from
+        
+        Returns:
+            str or None: Version folder name (e.g. "2.11.0") for installs found by
+                _find_latest_automation1_path, otherwise the normalized DLL path
+        """
+        if not self.aerotech_dll_path:
+            return None
+        dll_path = os.path.normcase(os.path.normpath(self.aerotech_dll_path))
+        release_dir = os.path.dirname(dll_path)
+        if os.path.basename(release_dir).lower() == "release":
+            version = os.path.basename(os.path.dirname(release_dir))
+            if version[:1].isdigit():
+                return version
+        return dll_path
+    
     def _init_net_objects(self):
         """Initialize .NET object references"""
         self.McdFormatConverter = None
         self.MachineControllerDefinition = None
         self.JObject = None
+        self.JsonFormatting = None
+        
+        # Static .NET methods bound once in initialize()
+        self._convert_to_mcd = None
+        self._calculate_parameters = None
+        self._convert_to_json = None
+        self._read_from_file = None
+        
+        # PropertyInfo handles resolved on first use, keyed by (.NET type, name)
+        self._property_cache = {}
         
         # Template paths
         self.template_path = os.path.join(self.base_dir, "GenerateMCD_Assets", "MS_Template.json")
@@ -506,6 +1673,9 @@ class McdProcessor:
         os.add_dll_directory(self.aerotech_dll_path)
         
         try:
+            # Start the runtime on first use
+            _load_clr()
+            
             # Load assemblies
             clr.AddReference(os.path.join(self.aerotech_dll_path, "Newtonsoft.Json.dll"))
             clr.AddReference(os.path.join(self.config_manager_path, "System.Configuration.ConfigurationManager.dll"))
@@ -516,8 +1686,10 @@ class McdProcessor:
             clr.AddReference(os.path.join(self.aerotech_dll_path, "Aerotech.Automation1.Applications.Wpf.dll"))
 
             # Get types
+            import Newtonsoft.Json
             import Newtonsoft.Json.Linq
             self.JObject = Newtonsoft.Json.Linq.JObject
+            self.JsonFormatting = Newtonsoft.Json.Formatting
 
             type_name1 = "Aerotech.Automation1.Applications.Wpf.McdFormatConverter, Aerotech.Automation1.Applications.Wpf"
             type_name2 = "Aerotech.Automation1.DotNetInternal.MachineControllerDefinition, Aerotech.Automation1.DotNetInternal"
@@ -528,6 +1700,12 @@ class McdProcessor:
             if self.McdFormatConverter is None or self.MachineControllerDefinition is None:
                 raise TypeError("Could not load required .NET types")
             
+            # Resolve reflection handles once instead of on every call
+            self._convert_to_mcd = self._bind_static_method(self.McdFormatConverter, "ConvertToMcd")
+            self._calculate_parameters = self._bind_static_method(self.McdFormatConverter, "CalculateParameters")
+            self._convert_to_json = self._bind_static_method(self.McdFormatConverter, "ConvertToJson")
+            self._read_from_file = self._bind_static_method(self.MachineControllerDefinition, "ReadFromFile")
+            
             self.initialized = True
 
         except Exception as e:
@@ -539,7 +1717,48 @@ class McdProcessor:
         if not self.initialized:
             raise RuntimeError("MCD processor not initialized. Call initialize() first.")
     
-    def convert_specs_to_mcd(self, specs_dict=None, electrical_dict=None, stage_type=None, axis=None, drive_type=None):
+    @staticmethod
+    def _bind_static_method(dotnet_type, method_name):
+        """
+        Bind a public static .NET method to a plain Python callable
+        
+        Prefers the method on pythonnet's Python-side class (a direct call);
+        falls back to invoking the MethodInfo resolved here once.
+        
+        Args:
+            dotnet_type: System.Type declaring the method
+            method_name (str): Static method name
+            
+        Returns:
+            callable: Function taking the method's arguments positionally
+            
+        Raises:
+            TypeError: If the method doesn't exist on the type
+        """
+        method_info = dotnet_type.GetMethod(method_name)
+        if method_info is None:
+            raise TypeError(f"Method {method_name} not found on {dotnet_type.FullName}")
+        
+        try:
+            namespace = importlib.import_module(str(dotnet_type.Namespace))
+            return getattr(getattr(namespace, str(dotnet_type.Name)), method_name)
+        except (ImportError, AttributeError):
+            return lambda *args: method_info.Invoke(None, list(args))
+    
+    def _get_property_value(self, dotnet_obj, property_name):
+        """Read a .NET property through a cached PropertyInfo handle"""
+        dotnet_type = dotnet_obj.GetType()
+        key = (dotnet_type, property_name)
+        prop = self._property_cache.get(key)
+        if prop is None:
+            prop = dotnet_type.GetProperty(property_name)
+            if prop is None:
+                raise AttributeError(f"Property {property_name} not found on {dotnet_type.FullName}")
+            self._property_cache[key] = prop
+        return prop.GetValue(dotnet_obj, None)
+    
+    def convert_specs_to_mcd(self, specs_dict=None, electrical_dict=None, stage_type=None, axis=None, drive_type=None,
+                             snapshot=None):
         """
         Convert specifications to MCD object using drive-specific templates with separated configs
         
@@ -578,23 +1797,61 @@ class McdProcessor:
         """
         self._check_initialized()
         
+        data = self.prepare_template(specs_dict, electrical_dict, stage_type, axis, drive_type, snapshot)
+        return self.convert_template_to_mcd(data)
+    
+    def prepare_template(self, specs_dict=None, electrical_dict=None, stage_type=None, axis=None, drive_type=None,
+                         snapshot=None):
+        """
+        Validate inputs and populate the drive template in memory
+        
+        This is the pure-Python half of convert_specs_to_mcd and does not
+        need the .NET runtime.
+        
+        Args:
+            Same as convert_specs_to_mcd, plus
+            snapshot (DriveConfigSnapshot, optional): Drive config version used
+                for validation and template population (default: current)
+            
+        Returns:
+            dict: Populated template data
+        """
+        snapshot = snapshot or self.drive_config_manager.snapshot
+        
         # Validate inputs separately
         self._validate_mechanical_specs(specs_dict)
         self._validate_electrical_specs(electrical_dict)
         if drive_type:
-            self._validate_drive_type(drive_type)
+            self._validate_drive_type(drive_type, snapshot)
+            self._validate_rules(drive_type, electrical_dict, snapshot)
         
-        # Update JSON config with separated configurations
-        self._update_json_config(specs_dict, electrical_dict, stage_type, axis, drive_type)
+        # Populate template in memory with separated configurations
+        data = self._update_json_config(specs_dict, electrical_dict, stage_type, axis, drive_type, snapshot)
         
-        with open(self.working_json_path, "r", encoding="utf-8") as f:
-            json_str = f.read()
+        if self.save_debug_templates:
+            self._save_debug_template(data, drive_type, stage_type)
         
-        jobject = self.JObject.Parse(json_str)
+        return data
+    
+    def convert_template_to_mcd(self, template_data):
+        """
+        Convert a populated template dict to an MCD object
+        
+        The template is serialized once and handed straight to JObject.Parse,
+        so no intermediate file is written.
+        
+        Args:
+            template_data (dict): Populated Machine Setup template
+            
+        Returns:
+            tuple: (mcd_obj, warnings)
+        """
+        self._check_initialized()
+        
+        jobject = self.JObject.Parse(json.dumps(template_data))
         warnings = List[String]()
 
-        convert_method = self.McdFormatConverter.GetMethod("ConvertToMcd")
-        mcd_obj = convert_method.Invoke(None, [jobject, warnings])
+        mcd_obj = self._convert_to_mcd(jobject, warnings)
         
         return mcd_obj, list(warnings)
     
@@ -603,8 +1860,7 @@ class McdProcessor:
         self._check_initialized()
         
         warnings = List[String]()
-        calculate_method = self.McdFormatConverter.GetMethod("CalculateParameters")
-        calculated_mcd = calculate_method.Invoke(None, [mcd_obj, warnings])
+        calculated_mcd = self._calculate_parameters(mcd_obj, warnings)
         
         return calculated_mcd, list(warnings)
     
@@ -615,8 +1871,7 @@ class McdProcessor:
         if not os.path.exists(mcd_path):
             raise FileNotFoundError(f"MCD file not found: {mcd_path}")
         
-        read_from_file = self.MachineControllerDefinition.GetMethod("ReadFromFile")
-        mcd = read_from_file.Invoke(None, [mcd_path])
+        mcd = self._read_from_file(mcd_path)
         
         # Version check
         version = mcd.SoftwareVersion
@@ -625,16 +1880,46 @@ class McdProcessor:
         
         return mcd
     
+    def register_parameter_group(self, group_name, prefix):
+        """
+        Register an extra parameter group for extract_parameter_groups_from_mcd
+        
+        Args:
+            group_name (str): Key in the returned dict (e.g. 'current_loop')
+            prefix (str): Parameter name prefix (e.g. 'CurrentLoop')
+        """
+        self.parameter_groups[group_name] = prefix
+    
     def extract_parameters_from_mcd(self, mcd_obj):
-        """Extract servo and feedforward parameters from MCD object"""
+        """Extract servo and feedforward parameters from MCD object
+        
+        Values are returned as int/float where numeric.
+        
+        Returns:
+            tuple: (servo_params, feedforward_params), or (None, None) on failure
+        """
+        groups = self.extract_parameter_groups_from_mcd(mcd_obj)
+        if groups is None:
+            return None, None
+        return groups['servo'], groups['feedforward']
+    
+    def extract_parameter_groups_from_mcd(self, mcd_obj, groups=None):
+        """
+        Extract all registered parameter groups from MCD object in one XML pass
+        
+        Args:
+            mcd_obj: .NET MCD object
+            groups (dict, optional): Group name -> prefix (default: self.parameter_groups)
+            
+        Returns:
+            dict: {group_name: {axis_index: [{'name', 'value'}]}}, or None on failure
+        """
         try:
             # Get ConfigurationFiles
-            dotnet_type = mcd_obj.GetType()
-            config_files_prop = dotnet_type.GetProperty("ConfigurationFiles")
-            config_files = config_files_prop.GetValue(mcd_obj, None)
+            config_files = self._get_property_value(mcd_obj, "ConfigurationFiles")
 
             if config_files is None:
-                return None, None
+                return None
 
             # Find Parameters entry
             parameters_filedata = None
@@ -645,44 +1930,58 @@ class McdProcessor:
                     break
 
             if parameters_filedata is None:
-                return None, None
+                return None
 
             # Extract content
-            content_prop = parameters_filedata.GetType().GetProperty("Content")
-            content_bytes = content_prop.GetValue(parameters_filedata, None)
+            content_bytes = self._get_property_value(parameters_filedata, "Content")
 
             if content_bytes is None:
-                return None, None
+                return None
 
-            # Convert and parse XML
+            # Parse XML bytes directly (single pass over all groups)
             py_bytes = bytes(bytearray(content_bytes))
-            xml_text = py_bytes.decode('utf-8')
-            
-            servo_params = self._extract_servo_parameters_from_xml(xml_text)
-            feedforward_params = self._extract_feedforward_parameters_from_xml(xml_text)
-            
-            return servo_params, feedforward_params
+            return extract_parameter_groups(py_bytes, groups or self.parameter_groups)
 
         except Exception as e:
             print(f"Error extracting parameters: {e}")
-            return None, None
+            return None
+    
+    def convert_mcd_to_json(self, mcd_path, output_json_path, compact=False):
+        """Convert MCD file to JSON (compact=True writes it without indentation)"""
+        json_text, warnings = self.convert_mcd_to_json_text(mcd_path, compact)
+
+        with open(output_json_path, 'w', encoding='utf-8') as f:
+            f.write(json_text)
+
+        return warnings
     
-    def convert_mcd_to_json(self, mcd_path, output_json_path):
-        """Convert MCD file to JSON"""
+    def convert_mcd_to_json_text(self, mcd_path, compact=False):
+        """
+        Convert MCD file to a JSON string
+        
+        Args:
+            mcd_path (str): MCD file to convert
+            compact (bool): Serialize without indentation or line breaks
+                (Newtonsoft Formatting.None) - one line, roughly half the size
+            
+        Returns:
+            tuple: (json_text, warnings)
+        """
         self._check_initialized()
         
         mcd_obj = self.read_mcd_file(mcd_path)
         
         warnings = List[String]()
-        convert_method = self.McdFormatConverter.GetMethod("ConvertToJson")
-        json_obj = convert_method.Invoke(None, [mcd_obj, warnings])
-
-        with open(output_json_path, 'w', encoding='utf-8') as f:
-            f.write(json_obj.ToString())
-
-        return list(warnings)
+        json_obj = self._convert_to_json(mcd_obj, warnings)
+        
+        if compact:
+            json_text = json_obj.ToString(getattr(self.JsonFormatting, "None"))
+        else:
+            json_text = json_obj.ToString()
+        return str(json_text), list(warnings)
     
-    def _update_json_config(self, specs_dict, electrical_dict, stage_type=None, axis=None, drive_type=None):
+    def _update_json_config(self, specs_dict, electrical_dict, stage_type=None, axis=None, drive_type=None,
+                            snapshot=None):
         """
         Update JSON configuration template with separated mechanical and electrical configs
         
@@ -691,7 +1990,7 @@ class McdProcessor:
         2. Update MechanicalProducts with specs_dict (no extraction needed)
         3. Update ElectricalProducts with electrical_dict (direct application)  
         4. Update InterconnectedAxes with axis and drive display naming
-        5. Save to working template file
+        5. Return the populated template (nothing is written to disk)
         
         Args:
             specs_dict (dict): Mechanical configuration options only
@@ -699,12 +1998,27 @@ class McdProcessor:
             stage_type (str): Stage model name
             axis (str): Axis identifier  
             drive_type (str): Drive model name for template selection
+            snapshot (DriveConfigSnapshot, optional): Drive config version for
+                display names (default: current)
+            
+        Returns:
+            dict: Populated template data
         """
-        # 1. Load appropriate template file
+        # 1. Load appropriate template file (parsed once, copied per call)
         template_file = self._get_template_file(drive_type)
         
-        with open(template_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        try:
+            data = self.template_cache.get(drive_type, template_file)
+        except FileNotFoundError:
+            if not drive_type:
+                raise
+            # STRICT: Error if template doesn't exist (no silent fallback)
+            available_drives = self.get_available_drive_types()
+            raise FileNotFoundError(
+                f"Template file not found: {drive_type}_Template.json\n"
+                f"Available drive types: {', '.join(available_drives)}\n"
+                f"Template directory: {self.template_dir}"
+            )
 
         # 2. Update MechanicalProducts (simple and clean - no extraction)
         mech_products = data.get("MechanicalProducts")
@@ -769,7 +2083,7 @@ class McdProcessor:
             if drive_type and "ElectricalAxis" in inter_axis:
                 if drive_type in ['XA4', 'iXA4', 'XR3', 'iXR3']:
                     # Use display_name from drive config for multi-axis drives
-                    drive_config = self.drive_config_manager.get_drive_config(drive_type)
+                    drive_config = self.drive_config_manager.get_drive_config(drive_type, snapshot)
                     if drive_config:
                         display_name = drive_config.get('display_name', drive_type)
                         inter_axis["ElectricalAxis"]["DisplayName"] = display_name
@@ -782,45 +2096,44 @@ class McdProcessor:
                         drive_name = electrical_products[0]["Name"]
                         inter_axis["ElectricalAxis"]["DisplayName"] = self._format_drive_display_name(drive_name)
 
-        # 5. Save updated config
-        os.makedirs(os.path.dirname(self.working_json_path), exist_ok=True)
-        with open(self.working_json_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        # 5. Hand back the populated config (caller decides whether to persist it)
+        return data
+
+    def _save_debug_template(self, data, drive_type=None, stage_type=None):
+        """
+        Save populated template with clear filename for troubleshooting
         
-        # DEBUG: Save populated template with clear filename for troubleshooting
+        Args:
+            data (dict): Populated template data
+            drive_type (str): Drive model name (used in filename)
+            stage_type (str): Stage model name (used in filename)
+            
+        Returns:
+            str: Path to debug JSON file
+        """
         debug_filename = f"DEBUG_populated_template_{drive_type or 'unknown'}_{stage_type or 'unknown'}.json"
         debug_path = os.path.join(os.path.dirname(self.working_json_path), debug_filename)
+        os.makedirs(os.path.dirname(debug_path), exist_ok=True)
         with open(debug_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
         print(f"🔍 DEBUG: Populated template saved to: {debug_path}")
+        return debug_path
 
     def _get_template_file(self, drive_type):
         """
-        Get template file path based on drive type with strict validation
+        Get template file path based on drive type
+        
+        Existence is not probed here; the template cache stats the file when
+        loading it and _update_json_config reports missing drive templates.
         
         Args:
             drive_type (str or None): Drive model name
             
         Returns:
             str: Path to template file
-            
-        Raises:
-            FileNotFoundError: If drive_type specified but template doesn't exist
         """
         if drive_type:
-            drive_template = os.path.join(self.template_dir, f"{drive_type}_Template.json")
-            
-            if os.path.exists(drive_template):
-                print(f"Using drive-specific template: {drive_type}_Template.json")
-                return drive_template
-            else:
-                # STRICT: Error if template doesn't exist (no silent fallback)
-                available_drives = self.get_available_drive_types()
-                raise FileNotFoundError(
-                    f"Template file not found: {drive_type}_Template.json\n"
-                    f"Available drive types: {', '.join(available_drives)}\n"
-                    f"Template directory: {self.template_dir}"
-                )
+            return os.path.join(self.template_dir, f"{drive_type}_Template.json")
     
         # Use default template when no drive_type specified
         return self.template_path
@@ -865,18 +2178,12 @@ class McdProcessor:
         if specs_dict is None:
             return  # Allow None
             
-        if not isinstance(specs_dict, dict):
+        if not isinstance(specs_dict, Mapping):
             raise ValueError("specs_dict must be a dictionary or None")
         
         # Check for electrical options that shouldn't be in specs_dict
-        electrical_keys = [
-            "bus voltage", "bus_voltage", "bus", 
-            "current", "multiplier", "motor supply voltage",
-            "axes", "expansion board"
-        ]
-        
         for key in specs_dict:
-            if key.lower() in electrical_keys:
+            if key.lower() in ELECTRICAL_OPTION_KEYS:
                 raise ValueError(
                     f"Electrical option '{key}' found in specs_dict. "
                     f"Please move to electrical_dict. "
@@ -896,7 +2203,7 @@ class McdProcessor:
         if electrical_dict is None:
             return  # Allow None
             
-        if not isinstance(electrical_dict, dict):
+        if not isinstance(electrical_dict, Mapping):
             raise ValueError("electrical_dict must be a dictionary or None")
         
         # Validate bus voltage format if present
@@ -906,23 +2213,49 @@ class McdProcessor:
                 if not bus_voltage.isdigit():
                     raise ValueError(f"Bus voltage must be numeric (with optional 'V' suffix), got: {value}")
 
-    def _validate_drive_type(self, drive_type):
+    def _validate_drive_type(self, drive_type, snapshot=None):
         """
-        Validate drive type and check if template exists
+        Validate drive type against the drive config version in use
+        
+        Template existence is checked when the template is loaded
+        (_update_json_config); drives without a drive_config.json entry are
+        allowed and simply skip option validation.
         
         Args:
             drive_type (str): Drive model name
+            snapshot (DriveConfigSnapshot, optional): Config version (default: current)
+            
+        Returns:
+            dict or None: The drive's configuration in that snapshot
             
         Raises:
             ValueError: If drive_type format is invalid
-            FileNotFoundError: If template doesn't exist
         """
         if not isinstance(drive_type, str) or not drive_type.strip():
             raise ValueError("drive_type must be a non-empty string")
         
-        # Template existence check will be done in _get_template_file
-        # This is just for format validation
-        
+        return self.drive_config_manager.get_drive_config(drive_type, snapshot)
+
+    def _validate_rules(self, drive_type, electrical_dict, snapshot=None):
+        """
+        Apply drive_config.json cross-option rules before any .NET work
+
+        Args:
+            drive_type (str): Drive model name
+            electrical_dict (dict or None): Electrical configuration options
+            snapshot (DriveConfigSnapshot, optional): Config version (default: current)
+
+        Raises:
+            ValueError: If an error-severity rule is violated
+        """
+        if not electrical_dict:
+            return
+
+        violations = self.drive_config_manager.check_validation_rules(drive_type, electrical_dict, snapshot)
+        errors = [v.message for v in violations if v.severity == RULE_SEVERITY_ERROR]
+        if errors:
+            raise ValueError("Electrical configuration violates drive rules: " + "; ".join(errors))
+
     def get_available_drive_types(self):
         """
         Auto-scan GenerateMCD_Assets folder for available drive templates
@@ -931,21 +2264,10 @@ class McdProcessor:
             list: Available drive types sorted alphabetically
             
         Examples: ["iXA4", "iXC4e", "XC4", "XR3"]
-        """
-        drive_types = []
         
-        if not os.path.exists(self.template_dir):
-            return drive_types
-            
-        try:
-            for filename in os.listdir(self.template_dir):
-                if filename.endswith("_Template.json") and filename != "MS_Template.json":
-                    drive_type = filename.replace("_Template.json", "")
-                    drive_types.append(drive_type)
-        except OSError as e:
-            print(f"Warning: Could not scan template directory {self.template_dir}: {e}")
-            
-        return sorted(drive_types)
+        Answered from the template directory index (see refresh_templates).
+        """
+        return self.template_index.drive_types()
     
     def get_drive_info(self, drive_type):
         """
@@ -984,13 +2306,69 @@ class McdProcessor:
             drive_info['controller_type'] = 'PcBased'
         
         # Check template existence
-        template_path = os.path.join(self.template_dir, f"{drive_type}_Template.json")
-        drive_info['template_exists'] = os.path.exists(template_path)
-        if drive_info['template_exists']:
-            drive_info['template_path'] = template_path
+        template_path = self.template_index.path(f"{drive_type}_Template.json")
+        drive_info['template_exists'] = template_path is not None
+        drive_info['template_path'] = template_path
         
         return drive_info
 
+    def get_template_cache_stats(self):
+        """Get hit/miss counters for the parsed template cache"""
+        return self.template_cache.stats()
+
+    def refresh_templates(self):
+        """
+        Rescan the template directory and re-parse added or changed templates
+        
+        Refreshes the template directory index, then loads changed templates
+        into the template cache so the next job does not pay for parsing;
+        removed ones are dropped.
+        
+        Returns:
+            bool: True if the template set changed (template_version was bumped)
+        """
+        previous = self.template_index.template_signatures()
+        self.template_index.refresh()
+        signature = self.template_index.template_signatures()
+        if signature == previous:
+            return False
+        
+        for drive_type in set(previous) - set(signature):
+            self.template_cache.invalidate(drive_type)
+        for drive_type, file_signature in signature.items():
+            if previous.get(drive_type) != file_signature:
+                try:
+                    self.template_cache.get(drive_type, self._get_template_file(drive_type))
+                except (OSError, ValueError) as e:
+                    print(f"⚠️ Could not load template for {drive_type}: {e}")
+        
+        self.template_version += 1
+        print(f"🔄 Drive templates reloaded (v{self.template_version}, {len(signature)} templates)")
+        return True
+
+    def start_hot_reload(self, interval=2.0):
+        """
+        Poll drive_config.json and the template directory in a background
+        thread, swapping in new versions as they change on disk
+        
+        Jobs already running keep the config snapshot and template copy
+        they started with.
+        
+        Args:
+            interval (float): Seconds between polls
+        """
+        if self._hot_reload_watcher is None:
+            self._hot_reload_watcher = PollingWatcher(
+                [self.drive_config_manager.refresh_if_changed, self.refresh_templates],
+                interval, "McdHotReload"
+            ).start()
+
+    def stop_hot_reload(self):
+        """Stop the background poll started by start_hot_reload"""
+        if self._hot_reload_watcher is not None:
+            self._hot_reload_watcher.stop()
+            self._hot_reload_watcher = None
+
     def get_available_drive_types_with_info(self):
         """Get available drive types with detailed configuration information"""
         return self.drive_config_manager.get_available_drive_types_with_info()
@@ -1092,55 +2470,183 @@ class McdProcessor:
     
     def _is_version_supported(self, ver_str):
         """Check if Automation1 version is supported"""
-        try:
-            parts = ver_str.split('.')
-            major = int(parts[0])
-            minor = int(parts[1]) if len(parts) > 1 else 0
-            return (major > 2) or (major == 2 and minor >= 11)
-        except Exception:
-            return False
-    
-    def _extract_servo_parameters_from_xml(self, xml_text):
-        """Extract ServoLoop parameters from XML"""
-        axis_servo_params = {}
-        root = ET.fromstring(xml_text)
-        for axis_elem in root.findall('.//Axes/Axis'):
-            axis_index = axis_elem.attrib.get('Index')
-            params = []
-            for p in axis_elem.findall('P'):
-                param_name = p.attrib.get('n', '')
-                if param_name.startswith('ServoLoop'):
-                    params.append({'name': param_name, 'value': p.text})
-            if params:
-                axis_servo_params[axis_index] = params
-        return axis_servo_params
-
-    def _extract_feedforward_parameters_from_xml(self, xml_text):
-        """Extract Feedforward parameters from XML"""
-        axis_feedforward_params = {}
-        root = ET.fromstring(xml_text)
-        for axis_elem in root.findall('.//Axes/Axis'):
-            axis_index = axis_elem.attrib.get('Index')
-            params = []
-            for p in axis_elem.findall('P'):
-                param_name = p.attrib.get('n', '')
-                if param_name.startswith('Feedforward'):
-                    params.append({'name': param_name, 'value': p.text})
-            if params:
-                axis_feedforward_params[axis_index] = params
-        return axis_feedforward_params
+        return is_version_supported(ver_str)
 
 # ============================================================================
 # FILE MANAGER
 # ============================================================================
 
+def _fsync_file(path):
+    """Flush a file's data to stable storage"""
+    # Windows only allows FlushFileBuffers on handles opened for writing
+    fd = os.open(path, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _fsync_directory(directory):
+    """Make renames in a directory durable (no-op on Windows)"""
+    if os.name == 'nt':
+        return
+    fd = os.open(directory or '.', os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+class VersionedNameAllocator:
+    """
+    Hands out "<name>_v<n><ext>" paths without probing v1, v2, ... one by one.
+    
+    Each directory is listed once; whether the unversioned name is taken
+    and the highest version per base name are cached, and the next
+    candidate is claimed by creating it with O_EXCL. If another process got
+    there first the claim fails and the next number is tried, so concurrent
+    writers (threads or processes) never share a name. As before, the first
+    versioned name is _v1.
+    
+    Claimed files are empty placeholders until written. release() removes
+    one whose write failed, and release_unwritten() (called by
+    FileManager.close()) removes any still unwritten. A process that dies
+    between claim and write leaves a 0-byte placeholder behind; it only
+    takes up that version number and can be deleted safely.
+    
+    Versions continue above the highest existing one - gaps left by deleted
+    files are not reused.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._highest = {}
+        self._taken_bases = set()
+        self._listed_dirs = set()
+        self._unwritten = set()
+    
+    def allocate(self, file_path):
+        """
+        Claim file_path, or its next free versioned name if it already exists
+        
+        Args:
+            file_path (str): Preferred path
+            
+        Returns:
+            str: Claimed path (an empty placeholder file now exists there)
+        """
+        directory, filename = os.path.split(file_path)
+        stem, ext = os.path.splitext(filename)
+        key = (os.path.normcase(os.path.abspath(directory or '.')), os.path.normcase(stem), os.path.normcase(ext))
+        
+        with self._lock:
+            if key[0] not in self._listed_dirs:
+                self._scan_directory(key[0])
+            
+            if key not in self._taken_bases:
+                self._taken_bases.add(key)
+                if self._claim(file_path):
+                    self._unwritten.add(file_path)
+                    return file_path
+            
+            version = self._highest.get(key, 0) + 1
+            while True:
+                candidate = os.path.join(directory, f"{stem}_v{version}{ext}")
+                if self._claim(candidate):
+                    self._highest[key] = version
+                    self._unwritten.add(candidate)
+                    return candidate
+                version += 1
+    
+    def mark_written(self, path):
+        """Record that a claimed placeholder now holds its MCD"""
+        with self._lock:
+            self._unwritten.discard(path)
+    
+    def release(self, path):
+        """Remove a claimed placeholder that was never written"""
+        with self._lock:
+            self._unwritten.discard(path)
+        try:
+            if os.path.getsize(path) == 0:
+                os.remove(path)
+        except OSError:
+            pass
+    
+    def release_unwritten(self):
+        """Remove every placeholder claimed but not (yet) written"""
+        with self._lock:
+            paths = self._unwritten
+            self._unwritten = set()
+        for path in paths:
+            self.release(path)
+    
+    def forget(self, directory=None):
+        """Drop cached versions for one directory (or all) so they are re-listed"""
+        with self._lock:
+            if directory is None:
+                self._highest.clear()
+                self._taken_bases.clear()
+                self._listed_dirs.clear()
+                return
+            directory = os.path.normcase(os.path.abspath(directory))
+            self._listed_dirs.discard(directory)
+            for key in [key for key in self._highest if key[0] == directory]:
+                del self._highest[key]
+            self._taken_bases = {key for key in self._taken_bases if key[0] != directory}
+    
+    def _scan_directory(self, directory):
+        """Record taken base names and the highest existing version of each (lock held)"""
+        self._listed_dirs.add(directory)
+        try:
+            names = os.listdir(directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            stem, ext = os.path.splitext(os.path.normcase(name))
+            self._taken_bases.add((directory, stem, ext))
+            base, sep, number = stem.rpartition('_v')
+            if sep and number.isdigit():
+                key = (directory, base, ext)
+                self._highest[key] = max(self._highest.get(key, 0), int(number))
+    
+    @staticmethod
+    def _claim(path):
+        """Atomically create path; False if it already exists"""
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        os.close(fd)
+        return True
+
 class FileManager:
     """
     Handles all file operations - naming, saving, path management.
     Uses strategy pattern for different naming and output approaches.
+    
+    With write_behind_workers > 0, WriteToFile runs on a bounded background
+    thread pool: save_mcd_file returns the final path as soon as the write is
+    queued, so slow (network) writes overlap with the next calculation.
+    Call flush() or close() before relying on the files being on disk.
+    
+    With atomic_writes, each MCD is written to a hidden temp file in the
+    target directory and renamed into place, so the final path never holds
+    a truncated file. durability then controls fsync:
+        'none'  - rely on the OS to write back (rename still atomic)
+        'file'  - fsync each file before the rename and its directory after
+        'batch' - no fsync per write; the next flush()/close() fsyncs every
+                  file written since the last flush, then each touched
+                  directory once
+    Directory fsync is skipped on Windows, where it isn't supported.
     """
     
-    def __init__(self, naming_strategy, output_strategy, overwrite_existing=True):
+    # Per-file write latency entries kept for get_write_stats()/write_log
+    WRITE_LOG_SIZE = 1000
+    
+    DURABILITY_MODES = ('none', 'file', 'batch')
+    
+    def __init__(self, naming_strategy, output_strategy, overwrite_existing=True,
+                 write_behind_workers=0, max_pending_writes=None,
+                 atomic_writes=False, durability='none'):
         """
         Initialize file manager with strategies
         
@@ -1148,15 +2654,61 @@ class FileManager:
             naming_strategy: Instance of NamingStrategy
             output_strategy: Instance of OutputStrategy  
             overwrite_existing: Whether to overwrite existing files
+            write_behind_workers: Background writer threads (0 = write synchronously)
+            max_pending_writes: Queued writes allowed before save_mcd_file
+                blocks (default: 4 per worker)
+            atomic_writes: Write to a temp file and rename into place
+            durability: 'none', 'file' or 'batch' fsync policy for atomic writes
         """
+        if durability not in self.DURABILITY_MODES:
+            raise ValueError(f"durability must be one of {', '.join(self.DURABILITY_MODES)}, got: {durability}")
+        
         self.naming_strategy = naming_strategy
         self.output_strategy = output_strategy
         self.overwrite_existing = overwrite_existing
+        self.atomic_writes = atomic_writes
+        self.durability = durability
+        self.write_behind_workers = write_behind_workers
+        self.max_pending_writes = max_pending_writes or 4 * max(write_behind_workers, 1)
+        self._init_write_state()
+    
+    def _init_write_state(self):
+        """Reset the background writer and name allocator (runtime-only state, never pickled)"""
+        self.name_allocator = VersionedNameAllocator()
+        self._executor = None
+        self._write_slots = threading.BoundedSemaphore(self.max_pending_writes)
+        self._write_lock = threading.Lock()
+        self._pending = {}
+        self._failed_writes = {}
+        self._unsynced_files = set()
+        self.write_log = deque(maxlen=self.WRITE_LOG_SIZE)
+        self._write_totals = {'writes': 0, 'failed': 0, 'total_s': 0.0, 'max_s': 0.0}
+    
+    def __getstate__(self):
+        # Worker processes (RecalculationFarm) get the strategies, not the threads
+        state = self.__dict__.copy()
+        for key in ('name_allocator', '_executor', '_write_slots', '_write_lock', '_pending',
+                    '_failed_writes', '_unsynced_files', 'write_log', '_write_totals'):
+            state.pop(key, None)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_write_state()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def save_mcd_file(self, mcd_obj, file_type, stage_type, context=None):
         """
         Save MCD object to file
         
+        In write-behind mode the write is only queued; errors surface from
+        flush()/close() or the future of save_mcd_file_async.
+        
         Args:
             mcd_obj: .NET MCD object to save
             file_type: 'calculated', 'uncalculated', or 'recalculated'
@@ -1164,8 +2716,201 @@ class FileManager:
             context: Additional context dict for naming
         
         Returns:
-            str: Path where file was saved
+            str: Path where file was (or will be) saved
+        """
+        final_path = self._reserve_path(file_type, stage_type, context)
+        if self.write_behind_workers > 0:
+            self._submit_write(mcd_obj, final_path)
+        else:
+            self._write(mcd_obj, final_path)
+        return final_path
+    
+    def save_mcd_file_async(self, mcd_obj, file_type, stage_type, context=None):
+        """
+        Save MCD object to file and return a future for the write
+        
+        Args:
+            Same as save_mcd_file
+            
+        Returns:
+            Future: Resolves to the saved path (already resolved when
+                    write-behind is disabled)
+        """
+        final_path = self._reserve_path(file_type, stage_type, context)
+        if self.write_behind_workers > 0:
+            return self._submit_write(mcd_obj, final_path)
+        
+        future = Future()
+        try:
+            future.set_result(self._write(mcd_obj, final_path))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    
+    def configure_write_behind(self, workers, max_pending_writes=None):
+        """
+        Switch write-behind on (workers > 0) or off (0) after flushing queued writes
+        
+        Returns:
+            list: Failed writes from the flush (see flush)
+        """
+        failures = self.close()
+        self.write_behind_workers = workers
+        self.max_pending_writes = max_pending_writes or 4 * max(workers, 1)
+        self._write_slots = threading.BoundedSemaphore(self.max_pending_writes)
+        return failures
+    
+    def flush(self):
+        """
+        Wait for every queued write to finish
+        
+        Returns:
+            list: Background writes that failed since the last flush, as
+                  {'path', 'error', 'error_type'} (empty if all succeeded)
+        """
+        with self._write_lock:
+            futures = dict(self._pending)
+        wait(list(futures.values()))
+        
+        with self._write_lock:
+            for path, future in futures.items():
+                self._record_failure(path, future)
+            failures = list(self._failed_writes.values())
+            self._failed_writes = {}
+            unsynced_files = self._unsynced_files
+            self._unsynced_files = set()
+        
+        # 'batch' durability: file data first, then one fsync per directory so the renames persist
+        for path in unsynced_files:
+            try:
+                _fsync_file(path)
+            except FileNotFoundError:
+                pass  # Removed or replaced since it was written
+        for directory in {os.path.dirname(path) for path in unsynced_files}:
+            _fsync_directory(directory)
+        
+        for failure in failures:
+            print(f"❌ Background write failed for {failure['path']}: {failure['error']}")
+        return failures
+    
+    def close(self):
+        """Flush queued writes, stop the writer threads and remove unwritten name placeholders"""
+        failures = self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.name_allocator.release_unwritten()
+        return failures
+    
+    def get_write_stats(self):
+        """
+        Get write latency statistics
+        
+        Returns:
+            dict: writes, failed, pending, total_s, max_s, mean_s and
+                  'recent' (latest per-file {'path', 'seconds', 'error'} entries)
         """
+        with self._write_lock:
+            totals = dict(self._write_totals)
+            totals['pending'] = len(self._pending)
+            totals['recent'] = list(self.write_log)
+        totals['mean_s'] = totals['total_s'] / totals['writes'] if totals['writes'] else 0.0
+        return totals
+    
+    def _write(self, mcd_obj, final_path):
+        """WriteToFile with latency accounting"""
+        start = time.perf_counter()
+        error = None
+        try:
+            if self.atomic_writes:
+                self._write_atomic(mcd_obj, final_path)
+            else:
+                mcd_obj.WriteToFile(final_path)
+        except Exception as e:
+            error = e
+            if not self.overwrite_existing:
+                self.name_allocator.release(final_path)
+            raise
+        finally:
+            self._record_write(final_path, time.perf_counter() - start, error)
+        if not self.overwrite_existing:
+            self.name_allocator.mark_written(final_path)
+        return final_path
+    
+    def _record_write(self, path, seconds, error=None):
+        """Add one write to the latency totals and write_log"""
+        with self._write_lock:
+            totals = self._write_totals
+            totals['writes'] += 1
+            totals['total_s'] += seconds
+            totals['max_s'] = max(totals['max_s'], seconds)
+            if error is not None:
+                totals['failed'] += 1
+            self.write_log.append({
+                'path': path,
+                'seconds': seconds,
+                'error': str(error) if error is not None else None
+            })
+    
+    def _write_atomic(self, mcd_obj, final_path):
+        """Write to a temp file beside final_path, then rename it into place"""
+        directory, filename = os.path.split(final_path)
+        stem, ext = os.path.splitext(filename)
+        # Hidden, unique per writer, and keeps the extension WriteToFile expects
+        temp_path = os.path.join(directory, f".{stem}.{os.getpid()}.{threading.get_ident()}.tmp{ext}")
+        try:
+            mcd_obj.WriteToFile(temp_path)
+            if self.durability == 'file':
+                _fsync_file(temp_path)
+            os.replace(temp_path, final_path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        
+        if self.durability == 'file':
+            _fsync_directory(directory)
+        elif self.durability == 'batch':
+            with self._write_lock:
+                self._unsynced_files.add(final_path)
+    
+    def _submit_write(self, mcd_obj, final_path):
+        """Queue a background write, blocking while max_pending_writes are queued"""
+        self._write_slots.acquire()
+        with self._write_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.write_behind_workers, thread_name_prefix="McdWriter")
+            # A second save to the same path must land after the first one
+            previous = self._pending.get(final_path)
+            
+            def write():
+                if previous is not None:
+                    wait([previous])
+                return self._write(mcd_obj, final_path)
+            
+            future = self._executor.submit(write)
+            self._pending[final_path] = future
+        
+        def done(finished):
+            with self._write_lock:
+                self._record_failure(final_path, finished)
+                if self._pending.get(final_path) is finished:
+                    del self._pending[final_path]
+            self._write_slots.release()
+        
+        future.add_done_callback(done)
+        return future
+    
+    def _record_failure(self, path, future):
+        """Remember a failed background write until the next flush (lock held)"""
+        error = future.exception()
+        if error is not None and future not in self._failed_writes:
+            self._failed_writes[future] = {'path': path, 'error': str(error), 'error_type': type(error).__name__}
+    
+    def _reserve_path(self, file_type, stage_type, context):
+        """Resolve the output path for a save (creating its directory if configured)"""
         # Generate filename
         filename = self.naming_strategy.generate_filename(file_type, stage_type, context)
         
@@ -1180,27 +2925,124 @@ class FileManager:
         file_path = os.path.join(output_dir, filename)
         
         # Handle existing files
-        final_path = self._handle_existing_file(file_path)
-        
-        # Save file
-        mcd_obj.WriteToFile(final_path)
-        
-        return final_path
+        return self._handle_existing_file(file_path)
     
     def _handle_existing_file(self, file_path):
         """Handle existing file based on overwrite setting"""
-        if not os.path.exists(file_path):
-            return file_path
-            
         if self.overwrite_existing:
             return file_path
+        
+        # Claim the path or its next versioned name (placeholder created atomically)
+        return self.name_allocator.allocate(file_path)
+
+class BundleFileManager(FileManager):
+    """
+    FileManager that packs every saved MCD into one bundle file instead of
+    one file per MCD (see McdArchive.McdBundle for reading/extracting).
+    
+    Each MCD is written to a local scratch file, appended to the bundle and
+    the scratch file deleted, so the output share sees a single file. The
+    bundle gets its manifest and is renamed into place by close() - call it
+    (or AerotechController.close()) when the batch is done. Saves are
+    serialized and write-behind does not apply. Use one per process.
+    """
+    
+    def __init__(self, naming_strategy, output_strategy, overwrite_existing=True, include_parameters=False):
+        """
+        Args:
+            naming_strategy: Instance of NamingStrategy (names inside the bundle)
+            output_strategy: BundleOutputStrategy
+            overwrite_existing: Replace an existing bundle (else write bundle_v<n>)
+            include_parameters: Also store each MCD's extracted parameter
+                groups as JSON for reading without parsing the MCD
+        """
+        if not isinstance(output_strategy, BundleOutputStrategy):
+            raise TypeError("BundleFileManager requires a BundleOutputStrategy")
+        super().__init__(naming_strategy, output_strategy, overwrite_existing)
+        self.include_parameters = include_parameters
+        self.bundle_path = None
+        self._writer = None
+        self._bundle_lock = threading.Lock()
+    
+    def __getstate__(self):
+        raise TypeError("BundleFileManager writes one bundle per process and can't be sent to workers")
+    
+    def save_mcd_file(self, mcd_obj, file_type, stage_type, context=None):
+        """
+        Append an MCD object to the bundle
+        
+        Args:
+            Same as FileManager.save_mcd_file
             
-        # Create versioned filename
-        base, ext = os.path.splitext(file_path)
-        counter = 1
-        while os.path.exists(f"{base}_v{counter}{ext}"):
-            counter += 1
-        return f"{base}_v{counter}{ext}"
+        Returns:
+            str: '<bundle path>::<name in bundle>'
+        """
+        context = context or {}
+        filename = self.naming_strategy.generate_filename(file_type, stage_type, context)
+        member = f"{self.output_strategy.get_output_directory(file_type)}/{filename}"
+        
+        start = time.perf_counter()
+        error = None
+        try:
+            fd, scratch_path = tempfile.mkstemp(suffix=os.path.splitext(filename)[1] or ".mcd")
+            os.close(fd)
+            try:
+                mcd_obj.WriteToFile(scratch_path)
+                with open(scratch_path, 'rb') as f:
+                    mcd_bytes = f.read()
+            finally:
+                os.remove(scratch_path)
+            
+            parameters = None
+            if self.include_parameters:
+                with McdArchive(mcd_bytes) as archive:
+                    parameters = archive.extract_parameter_groups()
+            
+            metadata = {
+                'file_type': file_type,
+                'stage_type': stage_type,
+                'axis': context.get('axis'),
+                'drive_type': context.get('drive_type'),
+                'source_path': context.get('source_path')
+            }
+            with self._bundle_lock:
+                member = self._open_writer().add(member, mcd_bytes, metadata, parameters)
+                bundle_path = self.bundle_path
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self._record_write(member, time.perf_counter() - start, error)
+        
+        return f"{bundle_path}::{member}"
+    
+    def save_mcd_file_async(self, mcd_obj, file_type, stage_type, context=None):
+        future = Future()
+        try:
+            future.set_result(self.save_mcd_file(mcd_obj, file_type, stage_type, context))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    
+    def close(self):
+        """Write the bundle manifest and move the bundle into place"""
+        with self._bundle_lock:
+            if self._writer is not None:
+                self._writer.close()
+                print(f"📦 Bundle written: {self.bundle_path} ({len(self._writer.entries)} MCDs)")
+                self._writer = None
+        return super().close()
+    
+    def _open_writer(self):
+        """Start the bundle on the first save (lock held)"""
+        if self._writer is None:
+            bundle_path = self.output_strategy.bundle_path
+            directory = os.path.dirname(bundle_path)
+            if directory and self.output_strategy.should_create_directories():
+                os.makedirs(directory, exist_ok=True)
+            self.bundle_path = self._handle_existing_file(bundle_path)
+            self._writer = McdBundleWriter(self.bundle_path)
+        return self._writer
 
 # ============================================================================
 # WORKFLOW CONFIGURATIONS
@@ -1210,19 +3052,25 @@ class WorkflowConfigs:
     """Pre-configured setups for common workflows"""
     
     @staticmethod
-    def checkout_automation(smart_string=None, output_dir=r"O:\CMP Check-out\Parameter Files\Automation1"):
+    def checkout_automation(smart_string=None, output_dir=r"O:\CMP Check-out\Parameter Files\Automation1",
+                            write_behind_workers=0, atomic_writes=False, durability='none'):
         """Configuration for checkout automation workflow
         
         Args:
             smart_string: Smart string for naming (optional)
             output_dir: Directory for calculated MCD files (default: CMP checkout folder)
+            write_behind_workers: Background writer threads for the network share (0 = synchronous)
+            atomic_writes: Write via temp file + rename so the share never holds a truncated MCD
+            durability: fsync policy for atomic writes ('none', 'file' or 'batch')
         """
         if smart_string:
             naming_strategy = SmartStringNamingStrategy(smart_string)
         else:
             naming_strategy = DefaultNamingStrategy(calculated_prefix="")
         output_strategy = SpecificDirectoryOutputStrategy(output_dir)
-        return FileManager(naming_strategy, output_strategy, overwrite_existing=True)
+        return FileManager(naming_strategy, output_strategy, overwrite_existing=True,
+                           write_behind_workers=write_behind_workers,
+                           atomic_writes=atomic_writes, durability=durability)
     
     @staticmethod
     def parameter_extraction_only():
@@ -1240,6 +3088,22 @@ class WorkflowConfigs:
             uncalculated_dir=output_dir or os.path.join(os.getcwd(), "uncalculated")
         )
         return FileManager(naming_strategy, output_strategy, overwrite_existing=True)
+    
+    @staticmethod
+    def bundle_output(bundle_path, include_parameters=False, naming_strategy=None):
+        """Configuration that packs all output MCDs into one bundle file
+        
+        Args:
+            bundle_path: Bundle file to write (finalized by close())
+            include_parameters: Store extracted parameters as JSON beside each MCD
+            naming_strategy: Names inside the bundle (default: standard prefixes)
+        """
+        return BundleFileManager(
+            naming_strategy or DefaultNamingStrategy(),
+            BundleOutputStrategy(bundle_path),
+            overwrite_existing=True,
+            include_parameters=include_parameters
+        )
 
 # ============================================================================
 # MAIN FACADE CLASS
@@ -1260,7 +3124,8 @@ class AerotechController:
                  file_manager=None,
                  save_calculated=True,
                  save_uncalculated=True, 
-                 save_recalculated=True):
+                 save_recalculated=True,
+                 calculation_cache=None):
         """
         Initialize controller with processor and file manager
         
@@ -1270,12 +3135,14 @@ class AerotechController:
             save_calculated: Whether to save calculated MCD files
             save_uncalculated: Whether to save uncalculated MCD files  
             save_recalculated: Whether to save recalculated MCD files
+            calculation_cache: CalculationCache used by calculate_parameters (None disables)
         """
         self.processor = processor or McdProcessor()
         self.file_manager = file_manager or FileManager(
             DefaultNamingStrategy(), 
             WorkingDirectoryOutputStrategy()
         )
+        self.calculation_cache = calculation_cache
         
         self.save_settings = {
             'calculated': save_calculated,
@@ -1459,8 +3326,11 @@ class AerotechController:
         Returns:
             tuple: (mcd_obj, warnings, file_path)
         """
+        # Pin the drive config version for validation, population and calculation
+        snapshot = self.processor.drive_config_manager.snapshot
+        
         # Auto-configure electrical settings if missing or invalid
-        if auto_configure_gui and drive_type and (not electrical_dict or not self._is_electrical_config_sufficient(electrical_dict, drive_type)):
+        if auto_configure_gui and drive_type and (not electrical_dict or not self._is_electrical_config_sufficient(electrical_dict, drive_type, snapshot)):
             print(f"\n🔧 Drive configuration needed for {drive_type}...")
             
             # Try to get configuration via GUI
@@ -1474,7 +3344,7 @@ class AerotechController:
                 # Keep original electrical_dict (might be empty or partial)
         
         mcd_obj, warnings = self.processor.convert_specs_to_mcd(
-            specs_dict, electrical_dict, stage_type, axis, drive_type
+            specs_dict, electrical_dict, stage_type, axis, drive_type, snapshot
         )
         
         file_path = None
@@ -1482,15 +3352,16 @@ class AerotechController:
         
         if should_save:
             context = {'axis': axis, 'drive_type': drive_type}
-            file_path = self.file_manager.save_mcd_file(
+            # Wait for a queued write: the caller gets mcd_obj back and may calculate it right away
+            file_path = self.file_manager.save_mcd_file_async(
                 mcd_obj, 'uncalculated', stage_type, context
-            )
+            ).result()
         
         return mcd_obj, warnings, file_path
     
-    def mcd_to_json(self, mcd_path, output_json_path):
+    def mcd_to_json(self, mcd_path, output_json_path, compact=False):
         """Convert MCD file to JSON file (always saves)"""
-        return self.processor.convert_mcd_to_json(mcd_path, output_json_path)
+        return self.processor.convert_mcd_to_json(mcd_path, output_json_path, compact)
     
     def calculate_parameters(self, specs_dict=None, electrical_dict=None, stage_type=None, axis=None, drive_type=None, save_calculated=None, save_uncalculated=None, auto_configure_gui=True):
         """
@@ -1517,48 +3388,254 @@ class AerotechController:
             FileNotFoundError: If drive_type template doesn't exist
             ValueError: If specs_dict format is invalid
         """
-        # Auto-configure electrical settings if missing or invalid
-        if auto_configure_gui and drive_type and (not electrical_dict or not self._is_electrical_config_sufficient(electrical_dict, drive_type)):
-            print(f"\n🔧 Drive configuration needed for {drive_type}...")
-            
-            # Try to get configuration via GUI
-            auto_electrical_dict = self.create_electrical_config_gui(drive_type)
+        # Pin the drive config version for validation, population and calculation
+        snapshot = self.processor.drive_config_manager.snapshot
+        
+        # Auto-configure electrical settings if missing or invalid
+        if auto_configure_gui and drive_type and (not electrical_dict or not self._is_electrical_config_sufficient(electrical_dict, drive_type, snapshot)):
+            print(f"\n🔧 Drive configuration needed for {drive_type}...")
+            
+            # Try to get configuration via GUI
+            auto_electrical_dict = self.create_electrical_config_gui(drive_type)
+            
+            if auto_electrical_dict:
+                electrical_dict = auto_electrical_dict
+                print("✅ Configuration obtained from GUI")
+            else:
+                print("❌ Configuration cancelled - proceeding with provided config")
+                # Keep original electrical_dict (might be empty or partial)
+        
+        try:
+            result = self._run_calculation_pipeline(
+                specs_dict, electrical_dict, stage_type, axis, drive_type,
+                save_calculated, save_uncalculated, snapshot=snapshot
+            )
+        finally:
+            # Persist LRU recency from cache hits (put() only saves on a miss)
+            if self.calculation_cache is not None:
+                self.calculation_cache.flush()
+        return result['calculated_mcd'], result['warnings'], result['calculated_path']
+    
+    def calculate_parameters_batch(self, jobs, stop_on_error=False, progress_callback=None, verbose=True):
+        """
+        Generate calculated MCDs for many stage/drive specifications in one pass
+        
+        The processor is initialized once and reused for every job; template
+        parsing is shared through the processor's template cache. A failing
+        job is recorded and the batch moves on (unless stop_on_error is set).
+        The GUI fallback is never shown in batch mode.
+        
+        Args:
+            jobs (iterable): Job specs, each either a dict with the keyword
+                arguments of calculate_parameters (specs_dict, electrical_dict,
+                stage_type, axis, drive_type, save_calculated, save_uncalculated)
+                or a (specs_dict, electrical_dict, stage_type, axis, drive_type) tuple
+            stop_on_error (bool): Abort the batch on the first failing job
+            progress_callback (callable, optional): Called as
+                progress_callback(index, result_or_error) after each job
+            verbose (bool): Print the throughput/timing report at the end
+            
+        Returns:
+            dict: {
+                'results': list of per-job result dicts (calculated_mcd, warnings,
+                           calculated_path, uncalculated_path, timings, ...),
+                'errors': list of per-job error dicts (index, job, stage, error),
+                'write_errors': failed background writes (index, path, error) -
+                                only with write-behind enabled,
+                'stats': throughput, accumulated per-stage timings and write latency
+            }
+        """
+        if not self.processor.initialized:
+            self.processor.initialize()
+        
+        results = []
+        errors = []
+        stage_totals = {}
+        batch_start = time.perf_counter()
+        
+        for index, job in enumerate(jobs):
+            timings = {'_current_stage': 'normalize'}
+            try:
+                job = self._normalize_batch_job(job)
+                result = self._run_calculation_pipeline(
+                    job.get('specs_dict'), job.get('electrical_dict'),
+                    job.get('stage_type'), job.get('axis'), job.get('drive_type'),
+                    job.get('save_calculated'), job.get('save_uncalculated'),
+                    timings=timings
+                )
+                result['index'] = index
+                results.append(result)
+                outcome = result
+            except Exception as e:
+                outcome = {
+                    'index': index,
+                    'job': job,
+                    'stage': timings.get('_current_stage'),
+                    'error': str(e),
+                    'error_type': type(e).__name__
+                }
+                errors.append(outcome)
+            
+            timings.pop('_current_stage', None)
+            for stage, elapsed in timings.items():
+                stage_totals[stage] = stage_totals.get(stage, 0.0) + elapsed
+            
+            if progress_callback:
+                progress_callback(index, outcome)
+            if stop_on_error and 'error' in outcome:
+                break
+        
+        # Queued writes belong to the batch: wait for them and attribute failures
+        paths = {}
+        for result in results:
+            for key in ('calculated_path', 'uncalculated_path'):
+                if result.get(key):
+                    paths[result[key]] = result['index']
+        write_errors = [
+            dict(failure, index=paths.get(failure['path']), stage='write')
+            for failure in self.file_manager.flush()
+        ]
+        
+        elapsed = time.perf_counter() - batch_start
+        total = len(results) + len(errors)
+        stats = {
+            'total': total,
+            'succeeded': len(results),
+            'failed': len(errors),
+            'elapsed_s': elapsed,
+            'jobs_per_second': total / elapsed if elapsed > 0 else 0.0,
+            'stage_totals_s': stage_totals,
+            'template_cache': self.processor.get_template_cache_stats(),
+            'calculation_cache': self.get_calculation_cache_stats(),
+            'writes': {key: value for key, value in self.file_manager.get_write_stats().items() if key != 'recent'}
+        }
+        if self.calculation_cache is not None:
+            self.calculation_cache.flush()
+        
+        if verbose:
+            self._print_batch_report(stats)
+        
+        return {'results': results, 'errors': errors, 'write_errors': write_errors, 'stats': stats}
+    
+    def _run_calculation_pipeline(self, specs_dict, electrical_dict, stage_type, axis, drive_type,
+                                  save_calculated=None, save_uncalculated=None, timings=None, snapshot=None):
+        """
+        Run the populate → convert → calculate → save steps for one job
+        
+        Args:
+            timings (dict, optional): Filled with elapsed seconds per stage;
+                '_current_stage' names the stage that was running if one raises
+            snapshot (DriveConfigSnapshot, optional): Drive config version pinned
+                by the caller (default: current)
             
-            if auto_electrical_dict:
-                electrical_dict = auto_electrical_dict
-                print("✅ Configuration obtained from GUI")
-            else:
-                print("❌ Configuration cancelled - proceeding with provided config")
-                # Keep original electrical_dict (might be empty or partial)
+        Returns:
+            dict: calculated_mcd, warnings, calculated_path, uncalculated_path,
+                  stage_type, axis, drive_type, config_version, timings
+        """
+        if timings is None:
+            timings = {}
+        context = {'axis': axis, 'drive_type': drive_type}
+        # Pin the drive config version for the whole job (hot reload may swap it meanwhile)
+        if snapshot is None:
+            snapshot = self.processor.drive_config_manager.snapshot
+        
+        def run_stage(stage, func, *args):
+            timings['_current_stage'] = stage
+            start = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                # Recorded for the stage that raised too
+                timings[stage] = time.perf_counter() - start
         
-        # Step 1: Convert specs to MCD with separated configurations
-        mcd_obj, conversion_warnings = self.processor.convert_specs_to_mcd(
-            specs_dict, electrical_dict, stage_type, axis, drive_type
-        )
+        should_save_uncalc = save_uncalculated if save_uncalculated is not None else self.save_settings['uncalculated']
         
-        # Step 2: Save uncalculated if requested
+        # Step 1: Populate template and check the result cache
+        template_data = run_stage('populate', self.processor.prepare_template,
+                                  specs_dict, electrical_dict, stage_type, axis, drive_type, snapshot)
+        cache_key = None
+        cached = None
+        if self.calculation_cache is not None:
+            def cache_lookup():
+                key = CalculationCache.make_key(template_data, self.processor.get_automation1_version())
+                return key, self.calculation_cache.lookup(key)
+            cache_key, cached = run_stage('cache_lookup', cache_lookup)
+        
+        # Step 2: Convert specs to MCD (skipped on a cache hit unless the uncalculated file is wanted)
+        mcd_obj = None
+        conversion_warnings = []
+        if cached is None or should_save_uncalc:
+            mcd_obj, conversion_warnings = run_stage('convert', self.processor.convert_template_to_mcd, template_data)
+        
+        # Step 3: Save uncalculated if requested
         uncalculated_path = None
-        should_save_uncalc = save_uncalculated if save_uncalculated is not None else self.save_settings['uncalculated']
         if should_save_uncalc:
-            context = {'axis': axis, 'drive_type': drive_type}
-            uncalculated_path = self.file_manager.save_mcd_file(
-                mcd_obj, 'uncalculated', stage_type, context
-            )
+            if cached is None:
+                # mcd_obj is calculated next: let a queued write finish first, since
+                # the .NET MCD object isn't known to be safe to use from two threads
+                def save_uncalculated():
+                    return self.file_manager.save_mcd_file_async(
+                        mcd_obj, 'uncalculated', stage_type, context).result()
+                uncalculated_path = run_stage('save_uncalculated', save_uncalculated)
+            else:
+                uncalculated_path = run_stage('save_uncalculated', self.file_manager.save_mcd_file,
+                                              mcd_obj, 'uncalculated', stage_type, context)
         
-        # Step 3: Calculate parameters
-        calculated_mcd, calculation_warnings = self.processor.calculate_mcd_parameters(mcd_obj)
+        # Step 4: Calculate parameters (or load the stored result)
+        if cached is not None:
+            cached_path, all_warnings = cached
+            calculated_mcd = run_stage('cache_load', self.processor.read_mcd_file, cached_path)
+        else:
+            calculated_mcd, calculation_warnings = run_stage('calculate', self.processor.calculate_mcd_parameters, mcd_obj)
+            all_warnings = conversion_warnings + calculation_warnings
+            if cache_key is not None:
+                run_stage('cache_store', self.calculation_cache.put, cache_key, calculated_mcd, all_warnings)
         
-        # Step 4: Save calculated if requested
+        # Step 5: Save calculated if requested
         calculated_path = None
         should_save_calc = save_calculated if save_calculated is not None else self.save_settings['calculated']
         if should_save_calc:
-            context = {'axis': axis, 'drive_type': drive_type}
-            calculated_path = self.file_manager.save_mcd_file(
-                calculated_mcd, 'calculated', stage_type, context
-            )
+            calculated_path = run_stage('save_calculated', self.file_manager.save_mcd_file,
+                                        calculated_mcd, 'calculated', stage_type, context)
         
-        all_warnings = conversion_warnings + calculation_warnings
-        return calculated_mcd, all_warnings, calculated_path
+        timings.pop('_current_stage', None)
+        return {
+            'calculated_mcd': calculated_mcd,
+            'warnings': all_warnings,
+            'cache_hit': cached is not None,
+            'calculated_path': calculated_path,
+            'uncalculated_path': uncalculated_path,
+            'stage_type': stage_type,
+            'axis': axis,
+            'drive_type': drive_type,
+            'config_version': snapshot.version,
+            'timings': dict(timings)
+        }
+    
+    @staticmethod
+    def _normalize_batch_job(job):
+        """Accept dict or positional tuple job specs"""
+        if isinstance(job, dict):
+            return job
+        if not isinstance(job, (tuple, list)):
+            raise TypeError(f"Batch job must be a dict or tuple, got {type(job).__name__}")
+        keys = ('specs_dict', 'electrical_dict', 'stage_type', 'axis', 'drive_type')
+        if len(job) > len(keys):
+            raise ValueError(f"Batch job tuple has {len(job)} fields, expected at most {len(keys)}")
+        return dict(zip(keys, job))
+    
+    @staticmethod
+    def _print_batch_report(stats):
+        """Print throughput and per-stage timing summary for a batch run"""
+        print(f"\n📊 Batch complete: {stats['succeeded']}/{stats['total']} succeeded, "
+              f"{stats['failed']} failed in {stats['elapsed_s']:.2f}s "
+              f"({stats['jobs_per_second']:.2f} jobs/s)")
+        for stage, total_s in stats['stage_totals_s'].items():
+            print(f"   • {stage:18}: {total_s:.3f}s total")
+        writes = stats.get('writes')
+        if writes and writes['writes']:
+            print(f"   • {'file writes':18}: {writes['writes']} files, mean {writes['mean_s'] * 1e3:.1f} ms, "
+                  f"max {writes['max_s'] * 1e3:.1f} ms, {writes['failed']} failed")
     
     def recalculate_and_extract(self, mcd_path, save_recalculated=None):
         """
@@ -1630,6 +3707,21 @@ class AerotechController:
         """Extract parameters from MCD object"""
         return self.processor.extract_parameters_from_mcd(mcd_obj)
     
+    def inspect_mcd_file(self, mcd_path):
+        """
+        Read parameters and version info straight from an MCD archive
+        
+        Uses the pure-Python McdArchive reader, so it works without
+        initialize() or an Automation1 installation. Parameters are the
+        values stored in the file (no recalculation).
+        
+        Returns:
+            tuple: (servo_params, feedforward_params, version_info)
+        """
+        with McdArchive(mcd_path) as archive:
+            servo_params, feedforward_params = archive.extract_parameters()
+            return servo_params, feedforward_params, archive.get_version_info()
+    
     def convert_to_json(self, mcd_path, output_json_path):
         """Convert MCD to JSON"""
         return self.mcd_to_json(mcd_path, output_json_path)
@@ -1655,6 +3747,67 @@ class AerotechController:
         """Get direct access to file manager for advanced usage"""
         return self.file_manager
     
+    def enable_calculation_cache(self, cache_dir, max_bytes=512 * 1024 * 1024):
+        """
+        Reuse stored results for identical calculate_parameters inputs
+        
+        Args:
+            cache_dir (str): Cache directory
+            max_bytes (int): LRU size bound for stored MCDs
+            
+        Returns:
+            CalculationCache: The cache now in use
+        """
+        self.calculation_cache = CalculationCache(cache_dir, max_bytes)
+        return self.calculation_cache
+    
+    def get_calculation_cache_stats(self):
+        """Get result cache hit-rate stats (None when caching is disabled)"""
+        if self.calculation_cache is None:
+            return None
+        return self.calculation_cache.stats()
+
+    def enable_write_behind(self, workers=4, max_pending=None):
+        """
+        Save MCD files on background threads so writes overlap with the next job
+        
+        Args:
+            workers (int): Writer threads
+            max_pending (int, optional): Queued writes before saving blocks
+        """
+        self.file_manager.configure_write_behind(workers, max_pending)
+    
+    def flush_writes(self):
+        """Wait for queued MCD writes; returns the failed ones"""
+        return self.file_manager.flush()
+    
+    def get_write_stats(self):
+        """Get per-file write latency statistics from the file manager"""
+        return self.file_manager.get_write_stats()
+    
+    def close(self):
+        """Flush queued writes and the result cache index, and stop background threads"""
+        failures = self.file_manager.close()
+        if self.calculation_cache is not None:
+            self.calculation_cache.flush()
+        self.stop_hot_reload()
+        return failures
+    
+    def start_hot_reload(self, interval=2.0):
+        """Reload drive_config.json and drive templates in the background as they change"""
+        self.processor.start_hot_reload(interval)
+
+    def stop_hot_reload(self):
+        """Stop background reloading"""
+        self.processor.stop_hot_reload()
+
+    def get_config_versions(self):
+        """Get the drive config and template set versions currently in service"""
+        return {
+            'config_version': self.processor.drive_config_manager.config_version,
+            'template_version': self.processor.template_version
+        }
+
     # ========================================================================
     # DRIVE CONFIGURATION METHODS
     # ========================================================================
@@ -1799,13 +3952,14 @@ class AerotechController:
     # HELPER METHODS
     # ========================================================================
     
-    def _is_electrical_config_sufficient(self, electrical_dict, drive_type):
+    def _is_electrical_config_sufficient(self, electrical_dict, drive_type, snapshot=None):
         """
         Check if electrical configuration has enough information for drive type
         
         Args:
             electrical_dict (dict): Electrical configuration to check
             drive_type (str): Drive type to check against
+            snapshot (DriveConfigSnapshot, optional): Config version (default: current)
             
         Returns:
             bool: True if config is sufficient, False if GUI needed
@@ -1815,14 +3969,15 @@ class AerotechController:
         
         try:
             # Use existing validation system
-            validation = self.validate_electrical_configuration(drive_type, electrical_dict)
+            manager = self.processor.drive_config_manager
+            validation = manager.validate_electrical_dict(drive_type, electrical_dict, snapshot)
             
             # If validation passes, config is sufficient
             if validation.get('valid', False):
                 return True
             
             # Check if it has at least some required options
-            menu_data = self.get_drive_menu_data(drive_type)
+            menu_data = manager.get_ui_menu_data_view(drive_type, snapshot)
             if not menu_data:
                 return bool(electrical_dict)  # If no menu data, any config is sufficient
             
@@ -1860,20 +4015,15 @@ class AerotechController:
         print(f"Electrical Specs: {electrical_dict}")
         
         # Just populate the template (don't convert to MCD)
-        self.processor._update_json_config(specs_dict, electrical_dict, stage_type, axis, drive_type)
+        data = self.processor._update_json_config(specs_dict, electrical_dict, stage_type, axis, drive_type)
         
-        # Get the debug file path
-        debug_filename = f"DEBUG_populated_template_{drive_type or 'unknown'}_{stage_type or 'unknown'}.json"
-        debug_path = os.path.join(self.processor.template_dir, debug_filename)
+        # Always persist here - writing the file is the point of this helper
+        debug_path = self.processor._save_debug_template(data, drive_type, stage_type)
         
         print(f"\n📋 Template Population Summary:")
         
-        # Load and analyze the populated template
-        import json
+        # Analyze the populated template
         try:
-            with open(debug_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
             # Show key sections
             if "MechanicalProducts" in data and data["MechanicalProducts"]:
                 mech = data["MechanicalProducts"][0]
@@ -1927,6 +4077,810 @@ class AerotechController:
             dict: Validation results with detailed feedback
         """
         return self.processor.validate_configuration_setup(specs_dict, electrical_dict, drive_type)
+    
+    def validate_configurations_bulk(self, rows, chunk_size=1000):
+        """
+        Validate a whole order book of axis configurations in one call
+        
+        Args:
+            rows (iterable or str): Row dicts ('drive_type', 'electrical_dict',
+                'specs_dict') or a CSV path (see read_validation_rows_csv)
+            chunk_size (int): Rows per group-by-drive pass
+            
+        Returns:
+            dict: Columnar results (see DriveConfigManager.validate_bulk)
+        """
+        if isinstance(rows, str):
+            rows = read_validation_rows_csv(rows)
+        return self.processor.drive_config_manager.validate_bulk(rows, chunk_size)
+
+    
+    def recalculate_many(self, mcd_paths, workers=None, save_recalculated=None, progress_callback=None, verbose=True,
+                         parameter_columns=None):
+        """
+        Recalculate and extract many MCD files on a pool of worker processes
+        
+        Each worker initializes its own McdProcessor (same DLL path and drive
+        config as this controller) and saves through this controller's file
+        manager settings, named after each source file (see RecalculationFarm).
+        
+        Args:
+            mcd_paths (iterable): MCD file paths (see find_mcd_files)
+            workers (int, optional): Worker process count (default: CPU count)
+            save_recalculated (bool): Override save setting for recalculated MCDs
+            progress_callback (callable, optional): Called as
+                progress_callback(completed, total, result) as results arrive
+            verbose (bool): Print the aggregate report at the end
+            parameter_columns (McdArchive.ParameterColumns, optional): Collect extracted
+                parameters as columns (for fleet statistics) instead of per-result dicts
+            
+        Returns:
+            dict: Aggregate report (see RecalculationFarm.run)
+        """
+        should_save = save_recalculated if save_recalculated is not None else self.save_settings['recalculated']
+        farm = RecalculationFarm(
+            workers=workers,
+            dll_path=self.processor.aerotech_dll_path,
+            drive_config_path=self.processor.drive_config_manager.config_file_path,
+            file_manager=self.file_manager,
+            save_recalculated=should_save
+        )
+        return farm.run(mcd_paths, progress_callback=progress_callback, verbose=verbose,
+                        parameter_columns=parameter_columns)
+    
+    def convert_many_to_jsonl(self, mcd_paths, output_path, workers=0, state_path=None, full=False,
+                              progress_callback=None, verbose=True):
+        """
+        Convert many MCD files to one JSON Lines file, skipping unchanged files
+        
+        Args:
+            mcd_paths (str or iterable): Directory tree to scan, or MCD file paths
+            output_path (str): JSON Lines output (one compact MCD per line)
+            workers (int): Worker processes (0 = convert on this controller)
+            state_path (str, optional): Change-tracking state (default: <output_path>.state.json)
+            full (bool): Rewrite the output and convert every file
+            progress_callback (callable, optional): progress_callback(completed, total, result)
+            verbose (bool): Print the report at the end
+            
+        Returns:
+            dict: Report (see McdJsonLinesConverter.run)
+        """
+        if isinstance(mcd_paths, str):
+            mcd_paths = find_mcd_files(mcd_paths)
+        converter = McdJsonLinesConverter(
+            output_path,
+            state_path=state_path,
+            workers=workers,
+            processor=self.processor,
+            dll_path=self.processor.aerotech_dll_path,
+            drive_config_path=self.processor.drive_config_manager.config_file_path
+        )
+        return converter.run(mcd_paths, full=full, progress_callback=progress_callback, verbose=verbose)
+    
+    def build_machine(self, jobs, manifest_path, force=False, dry_run=False, stop_on_error=False,
+                      progress_callback=None, verbose=True):
+        """
+        Regenerate only the axes whose inputs changed since the last build (like make)
+        
+        Each job's normalized specs_dict/electrical_dict, stage/axis/drive, drive
+        template hash, drive config hash and Automation1 version are compared
+        with the build manifest. Axes with identical inputs and an untouched
+        calculated MCD are skipped; the rest go through calculate_parameters_batch
+        (calculated MCDs are always saved) and are recorded on success.
+        
+        Args:
+            jobs (iterable): Job specs as for calculate_parameters_batch, one per axis
+            manifest_path (str): Build manifest JSON (created on first build)
+            force (bool): Rebuild every axis
+            dry_run (bool): Only report what would be rebuilt
+            stop_on_error (bool): Abort the rebuild on the first failing axis
+            progress_callback (callable, optional): Passed to calculate_parameters_batch
+            verbose (bool): Print the build report
+            
+        Returns:
+            dict: {
+                'built': [{key, reason, output_path, warnings}],
+                'skipped': [{key, output_path}] (up to date),
+                'stale': [{key, reason}] (everything that needed a rebuild),
+                'errors': per-axis error dicts from calculate_parameters_batch (plus 'key'),
+                'write_errors': failed background writes,
+                'stats': batch stats (None if nothing was rebuilt),
+                'dry_run': dry_run
+            }
+            
+        Raises:
+            TypeError: If the file manager writes bundles (outputs can't be checked)
+            ValueError: If two jobs map to the same manifest key or output file
+        """
+        if isinstance(self.file_manager, BundleFileManager):
+            raise TypeError("Incremental builds need loose-file output, not a bundle")
+        
+        manifest = BuildManifest(manifest_path)
+        stale = []
+        keys = set()
+        output_names = {}
+        report = {'built': [], 'skipped': [], 'stale': [], 'errors': [], 'write_errors': [],
+                  'stats': None, 'dry_run': dry_run}
+        
+        for job in jobs:
+            job = dict(self._normalize_batch_job(job))
+            key = BuildManifest.job_key(job)
+            if key in keys:
+                raise ValueError(f"Duplicate build key '{key}' - give each job a distinct axis")
+            keys.add(key)
+            if self.file_manager.overwrite_existing:
+                # Axes overwriting each other's output would never be up to date
+                output_name = os.path.normcase(self.file_manager.naming_strategy.generate_filename(
+                    'calculated', job.get('stage_type'), {'axis': job.get('axis'), 'drive_type': job.get('drive_type')}
+                ))
+                if output_name in output_names:
+                    raise ValueError(f"Axes '{output_names[output_name]}' and '{key}' would both be saved as "
+                                     f"{output_name} - use a naming strategy that includes the axis")
+                output_names[output_name] = key
+            inputs = manifest.fingerprint(job, self.processor)
+            reason = 'forced' if force else manifest.check(key, inputs)
+            if reason is None:
+                report['skipped'].append({'key': key, 'output_path': manifest.entries[key]['output_path']})
+            else:
+                stale.append((key, inputs, reason, job))
+                report['stale'].append({'key': key, 'reason': reason})
+        
+        if stale and not dry_run:
+            batch = self.calculate_parameters_batch(
+                [dict(job, save_calculated=True) for _, _, _, job in stale],
+                stop_on_error=stop_on_error, progress_callback=progress_callback, verbose=False
+            )
+            failed_writes = {failure['path'] for failure in batch['write_errors']}
+            for result in batch['results']:
+                key, inputs, reason, _ = stale[result['index']]
+                if result['calculated_path'] in failed_writes:
+                    continue
+                manifest.record(key, inputs, result['calculated_path'])
+                report['built'].append({
+                    'key': key,
+                    'reason': reason,
+                    'output_path': result['calculated_path'],
+                    'warnings': result['warnings']
+                })
+            report['errors'] = [dict(error, key=stale[error['index']][0]) for error in batch['errors']]
+            report['write_errors'] = batch['write_errors']
+            report['stats'] = batch['stats']
+            manifest.save()
+        
+        if verbose:
+            self._print_build_report(report)
+        return report
+    
+    @staticmethod
+    def _print_build_report(report):
+        """Print which axes were rebuilt, skipped or failed"""
+        label = "Build plan" if report['dry_run'] else "Build complete"
+        print(f"\n🏗️ {label}: {len(report['stale'])} to rebuild, {len(report['skipped'])} up to date"
+              + ("" if report['dry_run'] else f", {len(report['built'])} built, "
+                 f"{len(report['errors']) + len(report['write_errors'])} failed"))
+        for stale in report['stale']:
+            print(f"   🔨 {stale['key']}: {stale['reason']}")
+        for skipped in report['skipped']:
+            print(f"   ⏭️ {skipped['key']}: up to date ({skipped['output_path']})")
+        for error in report['errors']:
+            print(f"   ❌ {error['key']}: {error['error']}")
+        for failure in report['write_errors']:
+            print(f"   ❌ {failure['path']}: {failure['error']}")
+
+
+# ============================================================================
+# PARALLEL RECALCULATION FARM
+# ============================================================================
+
+# Per-process controller, created once by _init_recalculation_worker
+_worker_controller = None
+_worker_init_error = None
+
+def _init_recalculation_worker(dll_path, drive_config_path, file_manager, save_recalculated):
+    """Pool initializer: build and initialize one controller per worker process"""
+    global _worker_controller, _worker_init_error
+    try:
+        processor = McdProcessor(dll_path, drive_config_path)
+        processor.initialize()
+        if file_manager is not None and file_manager.write_behind_workers:
+            # The pool terminates workers without closing their file manager:
+            # write synchronously so every reported file_path is on disk
+            file_manager.configure_write_behind(0)
+        _worker_controller = AerotechController(
+            processor=processor,
+            file_manager=file_manager,
+            save_calculated=False,
+            save_uncalculated=False,
+            save_recalculated=save_recalculated
+        )
+    except Exception as e:
+        # Raising here would make the pool respawn workers forever;
+        # report the failure through every task instead
+        _worker_init_error = f"Worker initialization failed: {e}"
+
+def _recalculate_in_worker(mcd_path):
+    """Pool task: recalculate one file, returning a picklable result dict"""
+    start = time.perf_counter()
+    result = {'path': mcd_path, 'worker_pid': os.getpid()}
+    try:
+        if _worker_init_error:
+            raise RuntimeError(_worker_init_error)
+        servo_params, ff_params, _, file_path, warnings = _worker_controller.recalculate_and_extract(mcd_path)
+        if file_path:
+            # 'batch' durability fsyncs here; the pool never closes this manager
+            failures = _worker_controller.file_manager.flush()
+            if failures:
+                raise IOError(f"Saving {file_path} failed: {failures[0]['error']}")
+        result.update({
+            'ok': True,
+            'servo_params': servo_params,
+            'feedforward_params': ff_params,
+            'file_path': file_path,
+            'warnings': warnings
+        })
+    except Exception as e:
+        result.update({'ok': False, 'error': str(e), 'error_type': type(e).__name__})
+    result['elapsed_s'] = time.perf_counter() - start
+    return result
+
+def find_mcd_files(root_dir, extension=".mcd"):
+    """
+    Recursively list MCD files under a directory
+    
+    Args:
+        root_dir (str): Directory to scan (e.g. the Automation1 parameter share)
+        extension (str): MCD file extension
+        
+    Returns:
+        list: Sorted MCD file paths (same walk as McdArchive.find_mcd_paths)
+    """
+    return find_mcd_paths(root_dir, extension)
+
+class RecalculationFarm:
+    """
+    Multi-process recalculate_and_extract over many MCD files.
+    
+    Worker processes each initialize their own McdProcessor once, then pull
+    paths from the pool's task queue. Results stream back in completion order.
+    The file manager (and its strategies) must be picklable. Workers save
+    concurrently, so a file manager with any other naming strategy is copied
+    with SourceFileNamingStrategy to keep every output named after its source.
+    """
+    
+    def __init__(self, workers=None, dll_path=None, drive_config_path=None,
+                 file_manager=None, save_recalculated=False, chunksize=1):
+        """
+        Args:
+            workers (int, optional): Worker process count (default: CPU count)
+            dll_path (str, optional): Automation1 DLL directory for workers
+            drive_config_path (str, optional): drive_config.json path for workers
+            file_manager (FileManager, optional): Output/durability settings used when
+                save_recalculated is set; naming is always SourceFileNamingStrategy
+                (default: the working directory)
+            save_recalculated (bool): Whether workers save recalculated MCDs
+            chunksize (int): Paths handed to a worker per task-queue pull
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.dll_path = dll_path
+        self.drive_config_path = drive_config_path
+        if file_manager is None:
+            file_manager = FileManager(SourceFileNamingStrategy(), WorkingDirectoryOutputStrategy())
+        elif not isinstance(file_manager.naming_strategy, SourceFileNamingStrategy):
+            # A copy (fresh write state via __getstate__) so the caller's manager keeps its naming
+            file_manager = copy.copy(file_manager)
+            file_manager.naming_strategy = SourceFileNamingStrategy()
+        self.file_manager = file_manager
+        self.save_recalculated = save_recalculated
+        self.chunksize = chunksize
+        self.report = None
+    
+    def iter_results(self, mcd_paths, progress_callback=None):
+        """
+        Yield per-file result dicts as workers complete them
+        
+        Each result has 'path', 'ok', 'elapsed_s', 'worker_pid' and either
+        servo_params/feedforward_params/file_path/warnings or error/error_type.
+        self.report holds the aggregate report once iteration finishes.
+        
+        Args:
+            mcd_paths (iterable): MCD file paths
+            progress_callback (callable, optional): progress_callback(completed, total, result)
+        """
+        mcd_paths = list(mcd_paths)
+        total = len(mcd_paths)
+        report = {
+            'total': total,
+            'succeeded': 0,
+            'failed': 0,
+            'failures': [],
+            'worker_pids': set(),
+            'elapsed_s': 0.0,
+            'files_per_second': 0.0
+        }
+        self.report = report
+        start = time.perf_counter()
+        
+        # spawn: workers must not inherit a parent CLR via fork
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(
+            processes=min(self.workers, total) or 1,
+            initializer=_init_recalculation_worker,
+            initargs=(self.dll_path, self.drive_config_path, self.file_manager, self.save_recalculated)
+        ) as pool:
+            for completed, result in enumerate(pool.imap_unordered(_recalculate_in_worker, mcd_paths, self.chunksize), 1):
+                report['worker_pids'].add(result['worker_pid'])
+                if result['ok']:
+                    report['succeeded'] += 1
+                else:
+                    report['failed'] += 1
+                    report['failures'].append({'path': result['path'], 'error': result['error']})
+                
+                if progress_callback:
+                    progress_callback(completed, total, result)
+                yield result
+        
+        report['elapsed_s'] = time.perf_counter() - start
+        report['files_per_second'] = total / report['elapsed_s'] if report['elapsed_s'] > 0 else 0.0
+        report['worker_pids'] = sorted(report['worker_pids'])
+    
+    def run(self, mcd_paths, progress_callback=None, verbose=True, parameter_columns=None):
+        """
+        Recalculate every file and return the aggregate report
+        
+        Args:
+            parameter_columns (ParameterColumns, optional): Stream extracted
+                parameters into these columns as results arrive; the
+                servo_params/feedforward_params dicts are then dropped from results
+        
+        Returns:
+            dict: total, succeeded, failed, failures [{path, error}],
+                  worker_pids, elapsed_s, files_per_second, results
+        """
+        results = []
+        for result in self.iter_results(mcd_paths, progress_callback):
+            if parameter_columns is not None and result['ok']:
+                parameter_columns.add_groups(result['path'], {
+                    'servo': result.pop('servo_params'),
+                    'feedforward': result.pop('feedforward_params')
+                })
+            results.append(result)
+        report = dict(self.report, results=results)
+        
+        if verbose:
+            print(f"\n📊 Recalculation farm: {report['succeeded']}/{report['total']} succeeded, "
+                  f"{report['failed']} failed in {report['elapsed_s']:.1f}s "
+                  f"({report['files_per_second']:.2f} files/s on {len(report['worker_pids'])} workers)")
+            for failure in report['failures']:
+                print(f"   ❌ {failure['path']}: {failure['error']}")
+        
+        return report
+
+# ============================================================================
+# BATCH MCD TO JSON LINES
+# ============================================================================
+
+def _file_sha256(path, chunk_size=1024 * 1024):
+    """Hex SHA-256 of a file's contents, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# Per-process processor, created once by _init_json_worker
+_json_worker_processor = None
+
+def _init_json_worker(dll_path, drive_config_path):
+    """Pool initializer: build and initialize one McdProcessor per conversion worker"""
+    global _json_worker_processor, _worker_init_error
+    try:
+        processor = McdProcessor(dll_path, drive_config_path)
+        processor.initialize()
+        _json_worker_processor = processor
+    except Exception as e:
+        # Raising here would make the pool respawn workers forever;
+        # report the failure through every task instead
+        _worker_init_error = f"Worker initialization failed: {e}"
+
+def _convert_to_json_in_worker(mcd_path):
+    """Pool task: convert one file to compact JSON text"""
+    start = time.perf_counter()
+    result = {'path': mcd_path, 'worker_pid': os.getpid()}
+    try:
+        if _worker_init_error:
+            raise RuntimeError(_worker_init_error)
+        json_text, warnings = _json_worker_processor.convert_mcd_to_json_text(mcd_path, compact=True)
+        result.update({'ok': True, 'json': json_text, 'warnings': warnings})
+    except Exception as e:
+        result.update({'ok': False, 'error': str(e), 'error_type': type(e).__name__})
+    result['elapsed_s'] = time.perf_counter() - start
+    return result
+
+class McdJsonLinesConverter:
+    """
+    Convert many MCD files into one JSON Lines file.
+    
+    Each converted MCD becomes one line:
+        {"path": ..., "mtime_ns": ..., "sha256": ..., "warnings": [...], "mcd": {...}}
+    with the MCD JSON in compact form, written as soon as it is converted so
+    memory stays bounded by one file (per worker) regardless of tree size.
+    
+    A state file records each converted source's mtime, size and SHA-256.
+    Later runs convert only files whose contents changed (a touched but
+    identical file is not re-converted). The output is rebuilt in a temp
+    file beside it - new lines first, then the previous line of every
+    unchanged path - and renamed into place, so each path appears once.
+    Paths no longer passed to run() lose both their line and their state.
+    An interrupted run leaves the previous output and state untouched.
+    full=True converts everything.
+    
+    With workers > 0 conversion runs on a spawn process pool whose workers
+    each initialize one McdProcessor; results are written in completion order.
+    """
+    
+    LINE_PREFIX = '{"path":'  # Every output line starts with its source path
+    _decoder = json.JSONDecoder()
+    
+    def __init__(self, output_path, state_path=None, workers=0, processor=None,
+                 dll_path=None, drive_config_path=None, chunksize=1):
+        """
+        Args:
+            output_path (str): JSON Lines file to write
+            state_path (str, optional): State file (default: <output_path>.state.json)
+            workers (int): Worker processes (0 = convert in this process)
+            processor (McdProcessor, optional): Processor for in-process conversion
+                (created and initialized on first use if None)
+            dll_path (str, optional): Automation1 DLL directory for workers
+            drive_config_path (str, optional): drive_config.json path for workers
+            chunksize (int): Paths handed to a worker per task-queue pull
+        """
+        self.output_path = output_path
+        self.state_path = state_path or f"{output_path}.state.json"
+        self.workers = workers
+        self.processor = processor
+        self.dll_path = dll_path
+        self.drive_config_path = drive_config_path
+        self.chunksize = chunksize
+        self.report = None
+    
+    def plan(self, mcd_paths, state=None):
+        """
+        Split paths into files to convert and files unchanged since the last run
+        
+        Args:
+            mcd_paths (iterable): MCD file paths
+            state (dict, optional): Loaded state (default: read from state_path)
+            
+        Returns:
+            tuple: (pending [(path, state_entry)], skipped [path])
+        """
+        state = self._load_state() if state is None else state
+        pending, skipped = [], []
+        for mcd_path in mcd_paths:
+            mcd_path = os.path.abspath(mcd_path)
+            stat = os.stat(mcd_path)
+            entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+            previous = state.get(mcd_path)
+            if previous and previous['mtime_ns'] == entry['mtime_ns'] and previous['size'] == entry['size']:
+                skipped.append(mcd_path)
+                continue
+            entry['sha256'] = _file_sha256(mcd_path)
+            if previous and previous.get('sha256') == entry['sha256']:
+                state[mcd_path] = entry  # Touched but identical
+                skipped.append(mcd_path)
+                continue
+            pending.append((mcd_path, entry))
+        return pending, skipped
+    
+    def run(self, mcd_paths, full=False, progress_callback=None, verbose=True):
+        """
+        Convert changed files and rewrite the output with one line per path
+        
+        Args:
+            mcd_paths (iterable): Every MCD file that belongs in the output
+                (see find_mcd_files); others are removed from output and state
+            full (bool): Ignore the state and previous output and convert everything
+            progress_callback (callable, optional): progress_callback(completed, total, result)
+            verbose (bool): Print the report at the end
+            
+        Returns:
+            dict: total, converted, skipped, removed, failed, failures [{path, error}],
+                  bytes_written, elapsed_s, files_per_second
+        """
+        start = time.perf_counter()
+        mcd_paths = [os.path.abspath(mcd_path) for mcd_path in mcd_paths]
+        state = {} if full else self._load_state()
+        current = set(mcd_paths)
+        removed = [path for path in state if path not in current]
+        for path in removed:
+            del state[path]
+        
+        pending, skipped = self.plan(mcd_paths, state)
+        report = {
+            'total': len(pending) + len(skipped),
+            'converted': 0,
+            'skipped': len(skipped),
+            'removed': len(removed),
+            'failed': 0,
+            'failures': [],
+            'bytes_written': 0,
+            'elapsed_s': 0.0,
+            'files_per_second': 0.0
+        }
+        self.report = report
+        entries = dict(pending)
+        converted = set()
+        
+        directory = os.path.dirname(self.output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        temp_path = f"{self.output_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8', newline='\n') as output:
+                for completed, result in enumerate(self._iter_conversions([path for path, _ in pending]), 1):
+                    if result['ok']:
+                        entry = entries[result['path']]
+                        line = self._format_line(result, entry)
+                        output.write(line)
+                        report['bytes_written'] += len(line)
+                        report['converted'] += 1
+                        state[result['path']] = entry
+                        converted.add(result['path'])
+                    else:
+                        report['failed'] += 1
+                        report['failures'].append({'path': result['path'], 'error': result['error']})
+                    
+                    if progress_callback:
+                        progress_callback(completed, len(pending), result)
+                
+                # Unchanged files (and failed re-conversions) keep their previous line
+                if not full:
+                    keep = {path for path in state if path not in converted}
+                    report['bytes_written'] += self._copy_previous_lines(output, keep)
+            os.replace(temp_path, self.output_path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        self._save_state(state)
+        
+        report['elapsed_s'] = time.perf_counter() - start
+        report['files_per_second'] = report['converted'] / report['elapsed_s'] if report['elapsed_s'] > 0 else 0.0
+        
+        if verbose:
+            print(f"\n📊 MCD → JSON Lines: {report['converted']} converted, {report['skipped']} unchanged, "
+                  f"{report['removed']} removed, {report['failed']} failed in {report['elapsed_s']:.1f}s "
+                  f"→ {self.output_path}")
+            for failure in report['failures']:
+                print(f"   ❌ {failure['path']}: {failure['error']}")
+        
+        return report
+    
+    def _copy_previous_lines(self, output, keep):
+        """
+        Copy the last line of each kept path from the existing output
+        
+        Earlier duplicates and truncated or unparsable lines are dropped.
+        
+        Returns:
+            int: Characters copied
+        """
+        try:
+            source = open(self.output_path, 'r', encoding='utf-8', newline='\n')
+        except FileNotFoundError:
+            return 0
+        
+        with source:
+            last_line = {}
+            for number, line in enumerate(source):
+                path = self._line_path(line)
+                if path in keep:
+                    last_line[path] = number
+            wanted = set(last_line.values())
+            
+            copied = 0
+            source.seek(0)
+            for number, line in enumerate(source):
+                if number in wanted:
+                    output.write(line)
+                    copied += len(line)
+        return copied
+    
+    @classmethod
+    def _line_path(cls, line):
+        """Source path of an output line, read without parsing the MCD JSON (None if malformed)"""
+        if not line.startswith(cls.LINE_PREFIX) or not line.endswith('\n'):
+            return None
+        try:
+            path, _ = cls._decoder.raw_decode(line, len(cls.LINE_PREFIX))
+        except ValueError:
+            return None
+        return path if isinstance(path, str) else None
+    
+    def _iter_conversions(self, mcd_paths):
+        """Yield conversion result dicts, in-process or from the worker pool"""
+        if not mcd_paths:
+            return
+        
+        if self.workers:
+            context = multiprocessing.get_context("spawn")
+            with context.Pool(
+                processes=min(self.workers, len(mcd_paths)),
+                initializer=_init_json_worker,
+                initargs=(self.dll_path, self.drive_config_path)
+            ) as pool:
+                yield from pool.imap_unordered(_convert_to_json_in_worker, mcd_paths, self.chunksize)
+            return
+        
+        if self.processor is None:
+            self.processor = McdProcessor(self.dll_path, self.drive_config_path)
+        if not self.processor.initialized:
+            self.processor.initialize()
+        
+        for mcd_path in mcd_paths:
+            start = time.perf_counter()
+            result = {'path': mcd_path, 'worker_pid': os.getpid()}
+            try:
+                json_text, warnings = self.processor.convert_mcd_to_json_text(mcd_path, compact=True)
+                result.update({'ok': True, 'json': json_text, 'warnings': warnings})
+            except Exception as e:
+                result.update({'ok': False, 'error': str(e), 'error_type': type(e).__name__})
+            result['elapsed_s'] = time.perf_counter() - start
+            yield result
+    
+    @staticmethod
+    def _format_line(result, entry):
+        """One JSON Lines record; the MCD JSON text is spliced in without re-parsing"""
+        header = json.dumps({
+            'path': result['path'],
+            'mtime_ns': entry['mtime_ns'],
+            'sha256': entry['sha256'],
+            'warnings': result['warnings']
+        }, ensure_ascii=False, separators=(',', ':'))
+        json_text = result['json'].replace('\r', '').replace('\n', '')
+        return f"{header[:-1]},\"mcd\":{json_text}}}\n"
+    
+    def _load_state(self):
+        """Load {source path: {mtime_ns, size, sha256}}; missing or unreadable state starts empty"""
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+    
+    def _save_state(self, state):
+        """Persist the state atomically"""
+        temp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, separators=(',', ':'))
+        os.replace(temp_path, self.state_path)
+
+# ============================================================================
+# INCREMENTAL MACHINE BUILDS
+# ============================================================================
+
+def _normalize_options(options):
+    """Option dict with stripped string names and values, for stable fingerprints"""
+    return {str(name).strip(): str(value).strip() for name, value in (options or {}).items()}
+
+def _json_sha256(data):
+    """Hex SHA-256 of JSON data in canonical form (read-only config views included)"""
+    normalized = json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=dict)
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+class BuildManifest:
+    """
+    Per-axis record of the inputs and output of the last successful build.
+    
+    Used by AerotechController.build_machine to decide which axes to
+    regenerate. An axis is rebuilt when it is new, any recorded input
+    differs, or its calculated MCD was deleted or modified since the build.
+    """
+    
+    FORMAT_VERSION = 1
+    
+    def __init__(self, manifest_path):
+        """
+        Args:
+            manifest_path (str): Manifest JSON file (missing file = empty manifest)
+        """
+        self.manifest_path = manifest_path
+        self._template_hashes = {}
+        self.entries = self._load()
+    
+    @staticmethod
+    def job_key(job):
+        """Manifest key for a job: its axis, or stage/drive when no axis is given"""
+        return job.get('axis') or f"{job.get('stage_type')}:{job.get('drive_type')}"
+    
+    def fingerprint(self, job, processor):
+        """
+        Normalized inputs that determine a job's calculated MCD
+        
+        Args:
+            job (dict): Batch job spec
+            processor (McdProcessor): Supplies template path, drive config and Automation1 version
+            
+        Returns:
+            dict: JSON-ready inputs
+        """
+        drive_type = job.get('drive_type')
+        drive_config = processor.drive_config_manager.get_drive_config(drive_type) if drive_type else None
+        return {
+            'specs_dict': _normalize_options(job.get('specs_dict')),
+            'electrical_dict': _normalize_options(job.get('electrical_dict')),
+            'stage_type': job.get('stage_type'),
+            'axis': job.get('axis'),
+            'drive_type': drive_type,
+            'template_sha256': self._template_sha256(processor._get_template_file(drive_type)),
+            'drive_config_sha256': _json_sha256(drive_config) if drive_config is not None else None,
+            'automation1_version': processor.get_automation1_version()
+        }
+    
+    def check(self, key, inputs):
+        """
+        Decide whether an axis needs rebuilding
+        
+        Returns:
+            str or None: Reason to rebuild, or None if up to date
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return "new"
+        changed = [name for name in inputs if entry['inputs'].get(name) != inputs[name]]
+        if changed:
+            return f"changed: {', '.join(changed)}"
+        signature = _file_signature(entry['output_path'])
+        if signature is None:
+            return "output missing"
+        if list(signature) != entry['output_signature']:
+            return "output modified"
+        return None
+    
+    def record(self, key, inputs, output_path):
+        """Record a successful build of one axis"""
+        signature = _file_signature(output_path)
+        self.entries[key] = {
+            'inputs': inputs,
+            'output_path': output_path,
+            'output_signature': list(signature) if signature else None,
+            'built': time.strftime('%Y-%m-%dT%H:%M:%S')
+        }
+    
+    def save(self):
+        """Persist the manifest atomically"""
+        directory = os.path.dirname(self.manifest_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'format': self.FORMAT_VERSION, 'axes': self.entries}, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.manifest_path)
+    
+    def _load(self):
+        """Load entries; a missing, unreadable or other-format manifest rebuilds everything"""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('format') != self.FORMAT_VERSION:
+            return {}
+        return data.get('axes', {})
+    
+    def _template_sha256(self, template_path):
+        """Content hash of a drive template, reused while its (mtime, size) is unchanged"""
+        signature = _file_signature(template_path)
+        if signature is None:
+            return None
+        cached = self._template_hashes.get(template_path)
+        if cached is None or cached[0] != signature:
+            cached = (signature, _file_sha256(template_path))
+            self._template_hashes[template_path] = cached
+        return cached[1]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,799 @@
+"""
+McdArchive - Pure-Python MCD Reader
+===================================
+
+MCD files are zip archives holding an mcdInformation.xml header plus one XML
+document per configuration file under config/ (Parameters, MachineSetupData,
+...). This module reads them with zipfile only, so audit and reporting tools
+can inspect thousands of MCDs without pythonnet, coreclr or an Automation1
+installation.
+
+Reading only - recalculating or writing MCDs still needs GenerateMCD_v2.McdProcessor.
+
+MCD bundles (many MCDs packed into one zip with a manifest.json index, as
+written by GenerateMCD_v2.BundleFileManager) are read with McdBundle and
+unpacked with extract_bundle.
+
+ParameterColumns flattens extracted parameters from many MCDs into columns
+(file, group, axis_index, name, value) with dictionary-encoded strings, for
+fleet-wide statistics with NumPy, Arrow or Parquet (each used when installed).
+
+Example:
+    with McdArchive("Calculated_ANT95L.mcd") as archive:
+        print(archive.software_version)
+        servo_params, ff_params = archive.extract_parameters()
+
+    with McdBundle("batch.mcdz") as bundle:
+        entry = bundle.find(stage_type="ANT95L", axis="ST01")[0]
+        servo_params, ff_params = bundle.read_parameters(entry['name'])
+
+    columns = export_parameter_columns(find_mcd_paths("Recalculated"), "fleet.parquet")
+    table = columns.to_numpy()
+    gains = table['value'][table['name'] == columns.name_code("ServoLoopGainK")]
+"""
+import io
+import os
+import csv
+import json
+import time
+import array
+import zipfile
+import xml.etree.ElementTree as ET
+
+INFORMATION_ENTRY = "mcdInformation.xml"
+CONFIG_PREFIX = "config/"
+
+# ============================================================================
+# PARAMETER XML EXTRACTION
+# ============================================================================
+
+# Parameter groups extracted from the MCD Parameters XML: group name -> name prefix
+DEFAULT_PARAMETER_GROUPS = {
+    'servo': 'ServoLoop',
+    'feedforward': 'Feedforward'
+}
+
+def parse_parameter_value(text):
+    """
+    Convert a raw parameter value to int or float where possible
+
+    Args:
+        text (str or None): Raw element text
+
+    Returns:
+        int, float, str or None: Typed value (non-numeric text is returned as-is)
+    """
+    if text is None:
+        return None
+    text = text.strip()
+    if not text:
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+def extract_parameter_groups(xml_source, groups=None):
+    """
+    Sort axis parameters into prefix groups in a single streaming pass
+
+    Only <P> elements directly under Axes/Axis are considered. A parameter is
+    added to every group whose prefix it starts with.
+
+    Args:
+        xml_source (str or bytes): Parameters XML document
+        groups (dict, optional): Group name -> parameter name prefix
+            (default: DEFAULT_PARAMETER_GROUPS)
+
+    Returns:
+        dict: {group_name: {axis_index: [{'name': str, 'value': typed value}]}}
+    """
+    if groups is None:
+        groups = DEFAULT_PARAMETER_GROUPS
+    if isinstance(xml_source, str):
+        xml_source = xml_source.encode('utf-8')
+
+    prefixes = tuple(groups.items())
+    results = {group_name: {} for group_name in groups}
+    tag_stack = []
+    axis_index = None
+
+    for event, elem in ET.iterparse(io.BytesIO(xml_source), events=('start', 'end')):
+        if event == 'start':
+            if elem.tag == 'Axis' and tag_stack and tag_stack[-1] == 'Axes':
+                axis_index = elem.attrib.get('Index')
+            tag_stack.append(elem.tag)
+            continue
+
+        tag_stack.pop()
+        if elem.tag == 'P' and len(tag_stack) >= 2 and tag_stack[-1] == 'Axis' and tag_stack[-2] == 'Axes':
+            param_name = elem.attrib.get('n', '')
+            for group_name, prefix in prefixes:
+                if param_name.startswith(prefix):
+                    results[group_name].setdefault(axis_index, []).append(
+                        {'name': param_name, 'value': parse_parameter_value(elem.text)}
+                    )
+        elif elem.tag == 'Axis':
+            # Axis fully processed - release its children to keep memory flat
+            elem.clear()
+
+    return results
+
+def is_version_supported(ver_str):
+    """Check if Automation1 version is supported (2.11 or newer)"""
+    try:
+        parts = ver_str.split('.')
+        major = int(parts[0])
+        minor = int(parts[1]) if len(parts) > 1 else 0
+        return (major > 2) or (major == 2 and minor >= 11)
+    except Exception:
+        return False
+
+# ============================================================================
+# ARCHIVE READER
+# ============================================================================
+
+class McdArchive:
+    """Read-only view of an MCD file that never touches the .NET runtime"""
+
+    def __init__(self, mcd_path):
+        """
+        Open an MCD archive
+
+        Args:
+            mcd_path (str, bytes or file-like): Path to .mcd file, its raw
+                content, or an open binary stream
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file is not a valid MCD archive
+        """
+        if isinstance(mcd_path, (str, os.PathLike)) and not os.path.exists(mcd_path):
+            raise FileNotFoundError(f"MCD file not found: {mcd_path}")
+        if isinstance(mcd_path, (bytes, bytearray)):
+            mcd_path = io.BytesIO(mcd_path)
+
+        self.path = mcd_path
+        try:
+            self._zip = zipfile.ZipFile(mcd_path)
+        except zipfile.BadZipFile as e:
+            raise ValueError(f"Not a valid MCD archive: {mcd_path} ({e})")
+        self._information = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the underlying zip file"""
+        self._zip.close()
+
+    def list_configuration_files(self):
+        """
+        List configuration files stored in the archive
+
+        Returns:
+            list: Configuration file keys (e.g. ['MachineSetupData', 'Parameters'])
+        """
+        return [
+            name[len(CONFIG_PREFIX):] for name in self._zip.namelist()
+            if name.startswith(CONFIG_PREFIX) and not name.endswith('/')
+        ]
+
+    def read_configuration_file(self, key):
+        """
+        Read the raw bytes of one configuration file
+
+        Args:
+            key (str): Configuration file key (e.g. 'Parameters')
+
+        Returns:
+            bytes or None: File content, or None if the archive doesn't contain it
+        """
+        try:
+            return self._zip.read(CONFIG_PREFIX + key)
+        except KeyError:
+            return None
+
+    @property
+    def parameters_xml(self):
+        """Raw Parameters XML bytes (None if absent)"""
+        return self.read_configuration_file("Parameters")
+
+    def get_version_info(self):
+        """
+        Get version information from mcdInformation.xml
+
+        Returns:
+            dict: software_version, oldest_compatible_version, controller_type
+                  (values are None when the header is missing a field)
+        """
+        if self._information is None:
+            info = {
+                'software_version': None,
+                'oldest_compatible_version': None,
+                'controller_type': None
+            }
+            try:
+                root = ET.fromstring(self._zip.read(INFORMATION_ENTRY))
+            except KeyError:
+                root = None
+
+            if root is not None:
+                info['software_version'] = root.findtext('FileInformation/SoftwareVersion')
+                info['oldest_compatible_version'] = root.findtext('FileInformation/OldestCompatibleSoftwareVersion')
+                info['controller_type'] = root.findtext('Data/ControllerType')
+            self._information = info
+        return dict(self._information)
+
+    @property
+    def software_version(self):
+        """Automation1 version that wrote the archive"""
+        return self.get_version_info()['software_version']
+
+    def extract_parameter_groups(self, groups=None):
+        """
+        Extract parameter groups from the Parameters XML
+
+        Args:
+            groups (dict, optional): Group name -> prefix (default: servo/feedforward)
+
+        Returns:
+            dict: {group_name: {axis_index: [{'name', 'value'}]}}, or None if
+                  the archive has no Parameters file
+        """
+        xml_bytes = self.parameters_xml
+        if xml_bytes is None:
+            return None
+        return extract_parameter_groups(xml_bytes, groups)
+
+    def extract_parameters(self):
+        """
+        Extract servo and feedforward parameters (same shape as
+        McdProcessor.extract_parameters_from_mcd)
+
+        Returns:
+            tuple: (servo_params, feedforward_params), or (None, None)
+        """
+        groups = self.extract_parameter_groups(DEFAULT_PARAMETER_GROUPS)
+        if groups is None:
+            return None, None
+        return groups['servo'], groups['feedforward']
+
+    def summary(self):
+        """Get a one-dict summary for audit/reporting tools"""
+        version_info = self.get_version_info()
+        return {
+            'path': self.path,
+            'configuration_files': self.list_configuration_files(),
+            'version_supported': is_version_supported(version_info['software_version'] or ''),
+            **version_info
+        }
+
+def find_mcd_paths(root_dir, extension=".mcd"):
+    """Sorted MCD file paths under a directory tree"""
+    return sorted(
+        os.path.join(dirpath, filename)
+        for dirpath, _, filenames in os.walk(root_dir)
+        for filename in filenames
+        if filename.lower().endswith(extension)
+    )
+
+def scan_mcd_archives(root_dir, extension=".mcd"):
+    """
+    Walk a directory tree and yield a summary for every MCD archive
+
+    Unreadable files are reported with an 'error' key instead of raising.
+
+    Args:
+        root_dir (str): Directory to scan recursively
+        extension (str): MCD file extension
+
+    Yields:
+        dict: McdArchive.summary() result, or {'path', 'error'}
+    """
+    for mcd_path in find_mcd_paths(root_dir, extension):
+        try:
+            with McdArchive(mcd_path) as archive:
+                yield archive.summary()
+        except Exception as e:
+            yield {'path': mcd_path, 'error': str(e)}
+
+# ============================================================================
+# MCD BUNDLES
+# ============================================================================
+
+BUNDLE_MANIFEST = "manifest.json"
+BUNDLE_FORMAT_VERSION = 1
+
+class McdBundleWriter:
+    """
+    Pack MCDs into one zip bundle with a manifest.json index
+
+    MCDs are stored uncompressed (they are zip archives already); optional
+    parameter JSON is deflated. The bundle is built under a hidden temp name
+    beside the target and renamed into place by close(), so readers never
+    see a bundle without its manifest.
+    """
+
+    def __init__(self, bundle_path):
+        """
+        Args:
+            bundle_path (str): Final bundle path (replaced on close)
+        """
+        self.bundle_path = bundle_path
+        directory, filename = os.path.split(bundle_path)
+        self.temp_path = os.path.join(directory, f".{filename}.{os.getpid()}.tmp")
+        self._zip = zipfile.ZipFile(self.temp_path, 'w', zipfile.ZIP_STORED)
+        self.entries = []
+        self._names = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def add(self, name, mcd_bytes, metadata=None, parameters=None):
+        """
+        Append one MCD
+
+        Args:
+            name (str): Member name (e.g. 'calculated/Calculated_ANT95L.mcd');
+                repeated names get a _v<n> suffix
+            mcd_bytes (bytes): MCD file content
+            metadata (dict, optional): Extra manifest fields (stage_type, axis, ...)
+            parameters (dict, optional): JSON-ready parameters stored beside the MCD
+
+        Returns:
+            str: Member name actually used
+        """
+        name = self._unique_name(name)
+        self._zip.writestr(name, mcd_bytes)
+
+        entry = dict(metadata or {})
+        entry.update({'name': name, 'size': len(mcd_bytes), 'parameters': None})
+        if parameters is not None:
+            entry['parameters'] = os.path.splitext(name)[0] + ".params.json"
+            self._zip.writestr(
+                entry['parameters'],
+                json.dumps(parameters, separators=(',', ':')),
+                compress_type=zipfile.ZIP_DEFLATED
+            )
+        self.entries.append(entry)
+        return name
+
+    def close(self):
+        """Write the manifest and move the bundle into place"""
+        manifest = {
+            'format': BUNDLE_FORMAT_VERSION,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'entries': self.entries
+        }
+        self._zip.writestr(BUNDLE_MANIFEST, json.dumps(manifest, indent=1), compress_type=zipfile.ZIP_DEFLATED)
+        self._zip.close()
+        os.replace(self.temp_path, self.bundle_path)
+
+    def abort(self):
+        """Discard the partially written bundle"""
+        self._zip.close()
+        try:
+            os.remove(self.temp_path)
+        except OSError:
+            pass
+
+    def _unique_name(self, name):
+        if name not in self._names:
+            self._names.add(name)
+            return name
+        stem, ext = os.path.splitext(name)
+        counter = 1
+        while f"{stem}_v{counter}{ext}" in self._names:
+            counter += 1
+        name = f"{stem}_v{counter}{ext}"
+        self._names.add(name)
+        return name
+
+class McdBundle:
+    """Random-access reader for an MCD bundle"""
+
+    def __init__(self, bundle_path):
+        """
+        Open a bundle and load its manifest
+
+        Args:
+            bundle_path (str): Bundle file path
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file is not a valid bundle
+        """
+        if not os.path.exists(bundle_path):
+            raise FileNotFoundError(f"MCD bundle not found: {bundle_path}")
+
+        self.path = bundle_path
+        try:
+            self._zip = zipfile.ZipFile(bundle_path)
+            self.manifest = json.loads(self._zip.read(BUNDLE_MANIFEST))
+        except (zipfile.BadZipFile, KeyError, ValueError) as e:
+            raise ValueError(f"Not a valid MCD bundle: {bundle_path} ({e})")
+        self._by_name = {entry['name']: entry for entry in self.manifest.get('entries', [])}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the underlying zip file"""
+        self._zip.close()
+
+    @property
+    def entries(self):
+        """Manifest entries in the order they were written"""
+        return list(self._by_name.values())
+
+    def find(self, stage_type=None, axis=None, drive_type=None, file_type=None):
+        """
+        Look up entries by manifest fields (None matches anything)
+
+        Returns:
+            list: Matching manifest entries
+        """
+        criteria = {'stage_type': stage_type, 'axis': axis, 'drive_type': drive_type, 'file_type': file_type}
+        criteria = {key: value for key, value in criteria.items() if value is not None}
+        return [
+            entry for entry in self._by_name.values()
+            if all(entry.get(key) == value for key, value in criteria.items())
+        ]
+
+    def read_mcd(self, name):
+        """
+        Read one MCD's bytes
+
+        Raises:
+            KeyError: If the bundle has no such entry
+        """
+        if name not in self._by_name:
+            raise KeyError(f"No MCD named '{name}' in bundle {self.path}")
+        return self._zip.read(name)
+
+    def open_archive(self, name):
+        """Open one MCD as an McdArchive (read in memory, no extraction)"""
+        return McdArchive(self.read_mcd(name))
+
+    def read_parameters(self, name):
+        """
+        Get servo and feedforward parameters for one MCD
+
+        Uses the stored parameter JSON when the bundle has it, otherwise
+        parses the MCD.
+
+        Returns:
+            tuple: (servo_params, feedforward_params)
+        """
+        parameters_name = self._by_name.get(name, {}).get('parameters')
+        if parameters_name:
+            groups = json.loads(self._zip.read(parameters_name))
+            return groups.get('servo'), groups.get('feedforward')
+        with self.open_archive(name) as archive:
+            return archive.extract_parameters()
+
+    def extract(self, name, output_dir):
+        """
+        Write one MCD out as a standalone file
+
+        Returns:
+            str: Path of the extracted file
+
+        Raises:
+            KeyError: If the bundle has no such entry
+            ValueError: If the member name would land outside output_dir
+                (absolute path, drive letter or '..' component)
+        """
+        parts = name.replace('\\', '/').split('/')
+        if os.path.isabs(name) or os.path.splitdrive(name)[0] or any(part in ('', '.', '..') for part in parts):
+            raise ValueError(f"Unsafe member name '{name}' in bundle {self.path}")
+        output_path = os.path.join(output_dir, *parts)
+        root = os.path.realpath(output_dir)
+        if os.path.commonpath([root, os.path.realpath(output_path)]) != root:
+            raise ValueError(f"Member '{name}' would be extracted outside {output_dir}")
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, 'wb') as f:
+            f.write(self.read_mcd(name))
+        return output_path
+
+def extract_bundle(bundle_path, output_dir, **filters):
+    """
+    Unpack MCDs from a bundle into standalone files
+
+    Args:
+        bundle_path (str): Bundle file path
+        output_dir (str): Destination directory (file_type folders are kept)
+        **filters: stage_type / axis / drive_type / file_type to select entries
+
+    Returns:
+        list: Paths of the extracted files
+    """
+    with McdBundle(bundle_path) as bundle:
+        return [bundle.extract(entry['name'], output_dir) for entry in bundle.find(**filters)]
+
+# ============================================================================
+# COLUMNAR PARAMETER EXPORT
+# ============================================================================
+
+# Row layout of ParameterColumns.to_numpy() (string columns hold dictionary codes)
+PARAMETER_COLUMN_DTYPE = [
+    ('file', 'i4'), ('group', 'i2'), ('axis_index', 'i4'), ('name', 'i4'), ('value', 'f8')
+]
+
+class ParameterColumns:
+    """
+    Parameters from many MCDs stored as flat columns, one row per value
+
+    file, group and name are dictionary-encoded: the columns hold int codes
+    into the files/groups/names lists. Rows are appended to compact typed
+    arrays (about 22 bytes per parameter) as each MCD is read, instead of
+    nested {'name', 'value'} dicts. Non-numeric values are skipped and
+    counted in skipped_values; axis indexes that aren't integers become -1.
+    """
+
+    def __init__(self):
+        self.files = []
+        self.groups = []
+        self.names = []
+        self._codes = ({}, {}, {})
+        self._columns = {
+            'file': array.array('i'),
+            'group': array.array('h'),
+            'axis_index': array.array('i'),
+            'name': array.array('i'),
+            'value': array.array('d')
+        }
+        self.skipped_values = 0
+        self.failures = []
+
+    def __len__(self):
+        return len(self._columns['value'])
+
+    def add_groups(self, file_label, parameter_groups):
+        """
+        Append one MCD's extracted parameters
+
+        Args:
+            file_label (str): Value for the file column (usually the MCD path)
+            parameter_groups (dict): {group_name: {axis_index: [{'name', 'value'}]}}
+                as returned by extract_parameter_groups
+
+        Returns:
+            int: Rows added
+        """
+        columns = self._columns
+        file_code = self._encode(0, self.files, file_label)
+        added = 0
+        for group_name, axes in (parameter_groups or {}).items():
+            group_code = self._encode(1, self.groups, group_name)
+            for axis_index, params in (axes or {}).items():
+                try:
+                    axis_number = int(axis_index)
+                except (TypeError, ValueError):
+                    axis_number = -1
+                for param in params:
+                    value = param['value']
+                    if isinstance(value, bool) or not isinstance(value, (int, float)):
+                        self.skipped_values += 1
+                        continue
+                    columns['file'].append(file_code)
+                    columns['group'].append(group_code)
+                    columns['axis_index'].append(axis_number)
+                    columns['name'].append(self._encode(2, self.names, param['name']))
+                    columns['value'].append(value)
+                    added += 1
+        return added
+
+    def add_mcd(self, mcd_path, groups=None):
+        """
+        Read an MCD file and append its parameters
+
+        Args:
+            mcd_path (str): MCD file
+            groups (dict, optional): Group name -> prefix (default: servo/feedforward)
+
+        Returns:
+            int: Rows added (0 if the MCD has no Parameters file)
+        """
+        with McdArchive(mcd_path) as archive:
+            return self.add_groups(mcd_path, archive.extract_parameter_groups(groups))
+
+    def name_code(self, name):
+        """Dictionary code of a parameter name (-1 if it never occurred)"""
+        return self._codes[2].get(name, -1)
+
+    def column(self, name):
+        """
+        One column as a typed array
+
+        Returns:
+            numpy.ndarray (zero-copy view) when NumPy is installed, else array.array
+        """
+        values = self._columns[name]
+        try:
+            import numpy as np
+        except ImportError:
+            return values
+        return np.frombuffer(values, dtype=values.typecode) if len(values) else np.array([], dtype=values.typecode)
+
+    def to_numpy(self):
+        """
+        All columns as a NumPy structured array (see PARAMETER_COLUMN_DTYPE)
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        import numpy as np
+
+        table = np.empty(len(self), dtype=PARAMETER_COLUMN_DTYPE)
+        for name, _ in PARAMETER_COLUMN_DTYPE:
+            table[name] = self.column(name)
+        return table
+
+    def to_arrow(self):
+        """
+        All columns as a pyarrow Table with dictionary-typed file/group/name columns
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        import pyarrow as pa
+
+        def dictionary_column(column_name, dictionary):
+            indices = pa.array(self._columns[column_name], type=pa.int32())
+            return pa.DictionaryArray.from_arrays(indices, pa.array(dictionary, type=pa.string()))
+
+        return pa.table({
+            'file': dictionary_column('file', self.files),
+            'group': dictionary_column('group', self.groups),
+            'axis_index': pa.array(self._columns['axis_index'], type=pa.int32()),
+            'name': dictionary_column('name', self.names),
+            'value': pa.array(self._columns['value'], type=pa.float64())
+        })
+
+    def iter_rows(self):
+        """Yield decoded (file, group, axis_index, name, value) rows"""
+        columns = self._columns
+        for file_code, group_code, axis_index, name_code, value in zip(
+            columns['file'], columns['group'], columns['axis_index'], columns['name'], columns['value']
+        ):
+            yield self.files[file_code], self.groups[group_code], axis_index, self.names[name_code], value
+
+    def summarize(self):
+        """
+        Per-parameter-name count/mean/min/max across every file and axis
+
+        Returns:
+            dict: {name: {'count', 'mean', 'min', 'max'}}
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        if np is None or not len(self):
+            stats = {}
+            for name_code, value in zip(self._columns['name'], self._columns['value']):
+                entry = stats.setdefault(name_code, [0, 0.0, value, value])
+                entry[0] += 1
+                entry[1] += value
+                entry[2] = min(entry[2], value)
+                entry[3] = max(entry[3], value)
+            return {
+                self.names[code]: {'count': count, 'mean': total / count, 'min': low, 'max': high}
+                for code, (count, total, low, high) in stats.items()
+            }
+
+        codes = self.column('name')
+        values = self.column('value')
+        counts = np.bincount(codes, minlength=len(self.names))
+        sums = np.bincount(codes, weights=values, minlength=len(self.names))
+        minimums = np.full(len(self.names), np.inf)
+        maximums = np.full(len(self.names), -np.inf)
+        np.minimum.at(minimums, codes, values)
+        np.maximum.at(maximums, codes, values)
+        return {
+            name: {'count': int(counts[code]), 'mean': float(sums[code] / counts[code]),
+                   'min': float(minimums[code]), 'max': float(maximums[code])}
+            for code, name in enumerate(self.names) if counts[code]
+        }
+
+    def write(self, output_path):
+        """
+        Write the columns; the format follows the extension
+
+        .parquet - Parquet via pyarrow (dictionary encoding kept)
+        .feather / .arrow - Arrow IPC file via pyarrow
+        .npz - NumPy archive: 'table' structured array plus 'files'/'groups'/'names'
+        .csv - decoded rows, stdlib only
+
+        Returns:
+            str: output_path
+
+        Raises:
+            ValueError: For an unknown extension
+            ImportError: If the format's library is not installed
+        """
+        extension = os.path.splitext(output_path)[1].lower()
+        if extension == '.parquet':
+            import pyarrow.parquet as pq
+            pq.write_table(self.to_arrow(), output_path)
+        elif extension in ('.feather', '.arrow'):
+            import pyarrow.feather as feather
+            feather.write_feather(self.to_arrow(), output_path)
+        elif extension == '.npz':
+            import numpy as np
+            np.savez(output_path, table=self.to_numpy(), files=np.array(self.files, dtype=str),
+                     groups=np.array(self.groups, dtype=str), names=np.array(self.names, dtype=str))
+        elif extension == '.csv':
+            with open(output_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow([name for name, _ in PARAMETER_COLUMN_DTYPE])
+                writer.writerows(self.iter_rows())
+        else:
+            raise ValueError(f"Unsupported column export format '{extension}' (use .parquet, .feather, .npz or .csv)")
+        return output_path
+
+    def _encode(self, slot, values, value):
+        codes = self._codes[slot]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+def export_parameter_columns(mcd_paths, output_path=None, groups=None, columns=None):
+    """
+    Stream parameters from many MCD files into columns
+
+    Files are read one at a time. Unreadable files are reported and skipped.
+
+    Args:
+        mcd_paths (iterable): MCD file paths (see find_mcd_paths)
+        output_path (str, optional): Also write the columns (see ParameterColumns.write)
+        groups (dict, optional): Group name -> prefix (default: servo/feedforward)
+        columns (ParameterColumns, optional): Append to existing columns
+
+    Returns:
+        ParameterColumns: The collected columns ({'path', 'error'} dicts in .failures)
+    """
+    if columns is None:
+        columns = ParameterColumns()
+    for mcd_path in mcd_paths:
+        try:
+            columns.add_mcd(mcd_path, groups)
+        except Exception as e:
+            columns.failures.append({'path': mcd_path, 'error': str(e)})
+            print(f"❌ {mcd_path}: {e}")
+    if output_path:
+        columns.write(output_path)
+    return columns
+
+
+if __name__ == "__main__":
+    import sys
+
+    target = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), "Test Files")
+    for summary in scan_mcd_archives(target):
+        if 'error' in summary:
+            print(f"❌ {summary['path']}: {summary['error']}")
+        else:
+            print(f"✅ {summary['path']}: v{summary['software_version']} "
+                  f"({', '.join(summary['configuration_files'])})")
@@ -0,0 +1,333 @@
+"""
+McdDiff - Parameter Diff Between MCD Files
+==========================================
+
+Compares the axis parameters of two MCD files - typically the same machine
+calculated by two Automation1 versions - or of every paired MCD in two
+directory trees. Parameters are read with McdArchive (no .NET needed) and
+aligned by (axis index, parameter name) through dict indexes, so each file
+pair is compared in one pass regardless of parameter order.
+
+Values are "changed" when they differ beyond the numeric tolerances
+(math.isclose with rel_tol/abs_tol); non-numeric values must match exactly.
+
+Directory diffs pair files by relative path and run on a process pool. The
+result is a JSON-ready report with a summary plus per-file added/removed/
+changed parameters.
+
+Usage:
+    python McdDiff.py "Recalculated 2.10" "Recalculated 2.11" --json diff.json --rel-tol 1e-6
+
+    result = diff_mcd_files("old/Calculated_ANT95L.mcd", "new/Calculated_ANT95L.mcd")
+    report = diff_directories("old", "new", workers=8)
+"""
+import os
+import sys
+import json
+import math
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from McdArchive import McdArchive, find_mcd_paths
+
+sys.dont_write_bytecode = True
+
+# Every axis parameter (empty prefix matches all names)
+ALL_PARAMETERS = {'all': ''}
+
+DEFAULT_REL_TOL = 1e-9
+DEFAULT_ABS_TOL = 0.0
+
+# ============================================================================
+# PARAMETER DIFF
+# ============================================================================
+
+def index_parameters(parameter_groups):
+    """
+    Flatten extracted parameter groups into a (axis_index, name) -> value index
+
+    Args:
+        parameter_groups (dict): {group_name: {axis_index: [{'name', 'value'}]}}
+            as returned by McdArchive.extract_parameter_groups (None = empty)
+
+    Returns:
+        dict: {(axis_index, name): value}
+    """
+    index = {}
+    for axes in (parameter_groups or {}).values():
+        for axis_index, params in axes.items():
+            for param in params:
+                index[(axis_index, param['name'])] = param['value']
+    return index
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def values_match(old_value, new_value, rel_tol=DEFAULT_REL_TOL, abs_tol=DEFAULT_ABS_TOL):
+    """Compare two parameter values (numbers within tolerance, anything else exactly)"""
+    if _is_number(old_value) and _is_number(new_value):
+        return math.isclose(old_value, new_value, rel_tol=rel_tol, abs_tol=abs_tol)
+    return old_value == new_value
+
+def diff_parameters(old_groups, new_groups, rel_tol=DEFAULT_REL_TOL, abs_tol=DEFAULT_ABS_TOL):
+    """
+    Diff two sets of extracted parameters
+
+    Args:
+        old_groups (dict): Parameter groups of the baseline MCD
+        new_groups (dict): Parameter groups of the MCD to compare
+        rel_tol (float): Relative tolerance for numeric values
+        abs_tol (float): Absolute tolerance for numeric values
+
+    Returns:
+        dict: {
+            'added': [{axis_index, name, value}],
+            'removed': [{axis_index, name, value}],
+            'changed': [{axis_index, name, old, new, delta, rel_delta}],
+            'unchanged': count
+        } with lists sorted by axis index then name
+    """
+    old_index = index_parameters(old_groups)
+    new_index = index_parameters(new_groups)
+
+    added = [
+        {'axis_index': axis_index, 'name': name, 'value': value}
+        for (axis_index, name), value in new_index.items() if (axis_index, name) not in old_index
+    ]
+    removed = []
+    changed = []
+    unchanged = 0
+    for key, old_value in old_index.items():
+        if key not in new_index:
+            removed.append({'axis_index': key[0], 'name': key[1], 'value': old_value})
+            continue
+        new_value = new_index[key]
+        if values_match(old_value, new_value, rel_tol, abs_tol):
+            unchanged += 1
+            continue
+        change = {'axis_index': key[0], 'name': key[1], 'old': old_value, 'new': new_value,
+                  'delta': None, 'rel_delta': None}
+        if _is_number(old_value) and _is_number(new_value):
+            change['delta'] = new_value - old_value
+            if old_value:
+                change['rel_delta'] = (new_value - old_value) / abs(old_value)
+        changed.append(change)
+
+    def sort_key(entry):
+        # Integer indexes (stored as strings in MCD JSON) sort numerically, before any others
+        axis_index = str(entry['axis_index'])
+        try:
+            return (0, int(axis_index), '', entry['name'])
+        except ValueError:
+            return (1, 0, axis_index, entry['name'])
+
+    return {
+        'added': sorted(added, key=sort_key),
+        'removed': sorted(removed, key=sort_key),
+        'changed': sorted(changed, key=sort_key),
+        'unchanged': unchanged
+    }
+
+def diff_mcd_files(old_path, new_path, groups=None, rel_tol=DEFAULT_REL_TOL, abs_tol=DEFAULT_ABS_TOL):
+    """
+    Diff the parameters of two MCD files
+
+    Args:
+        old_path (str): Baseline MCD
+        new_path (str): MCD to compare
+        groups (dict, optional): Group name -> prefix to compare (default: every parameter)
+        rel_tol (float): Relative tolerance for numeric values
+        abs_tol (float): Absolute tolerance for numeric values
+
+    Returns:
+        dict: old_path, new_path, old_version, new_version plus the
+              diff_parameters result
+    """
+    groups = groups or ALL_PARAMETERS
+    with McdArchive(old_path) as old_archive, McdArchive(new_path) as new_archive:
+        result = {
+            'old_path': old_path,
+            'new_path': new_path,
+            'old_version': old_archive.software_version,
+            'new_version': new_archive.software_version
+        }
+        result.update(diff_parameters(
+            old_archive.extract_parameter_groups(groups),
+            new_archive.extract_parameter_groups(groups),
+            rel_tol, abs_tol
+        ))
+    return result
+
+# ============================================================================
+# DIRECTORY DIFF
+# ============================================================================
+
+def pair_mcd_files(old_dir, new_dir, extension=".mcd"):
+    """
+    Pair MCD files in two trees by relative path (case-insensitive where the OS is)
+
+    Returns:
+        tuple: (pairs [(old_path, new_path)], only_old [path], only_new [path])
+    """
+    def relative_index(root_dir):
+        return {
+            os.path.normcase(os.path.relpath(path, root_dir)): path
+            for path in find_mcd_paths(root_dir, extension)
+        }
+
+    old_files = relative_index(old_dir)
+    new_files = relative_index(new_dir)
+    pairs = [(old_files[key], new_files[key]) for key in sorted(old_files) if key in new_files]
+    only_old = [old_files[key] for key in sorted(old_files) if key not in new_files]
+    only_new = [new_files[key] for key in sorted(new_files) if key not in old_files]
+    return pairs, only_old, only_new
+
+def _diff_pair(task):
+    """Pool task: diff one file pair, reporting errors instead of raising"""
+    old_path, new_path, groups, rel_tol, abs_tol = task
+    try:
+        return diff_mcd_files(old_path, new_path, groups, rel_tol, abs_tol)
+    except Exception as e:
+        return {'old_path': old_path, 'new_path': new_path, 'error': str(e)}
+
+def diff_directories(old_dir, new_dir, groups=None, rel_tol=DEFAULT_REL_TOL, abs_tol=DEFAULT_ABS_TOL,
+                     workers=None, chunksize=4, extension=".mcd"):
+    """
+    Diff every MCD pair in two directory trees
+
+    Args:
+        old_dir (str): Baseline tree (e.g. MCDs recalculated with the old Automation1)
+        new_dir (str): Tree to compare
+        groups (dict, optional): Group name -> prefix to compare (default: every parameter)
+        rel_tol (float): Relative tolerance for numeric values
+        abs_tol (float): Absolute tolerance for numeric values
+        workers (int, optional): Worker processes (default: CPU count, 0 = in-process)
+        chunksize (int): Pairs handed to a worker at a time
+        extension (str): MCD file extension
+
+    Returns:
+        dict: {
+            'old_dir', 'new_dir', 'rel_tol', 'abs_tol',
+            'summary': counts plus the most frequently changed parameter names,
+            'only_old': [path], 'only_new': [path],
+            'files': per-pair results (diff_mcd_files, or {old_path, new_path, error})
+        }
+    """
+    start = time.perf_counter()
+    pairs, only_old, only_new = pair_mcd_files(old_dir, new_dir, extension)
+    tasks = [(old_path, new_path, groups, rel_tol, abs_tol) for old_path, new_path in pairs]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            files = list(executor.map(_diff_pair, tasks, chunksize=chunksize))
+    else:
+        files = [_diff_pair(task) for task in tasks]
+
+    changed_names = Counter()
+    summary = {
+        'pairs': len(files),
+        'identical': 0,
+        'with_differences': 0,
+        'errors': 0,
+        'only_old': len(only_old),
+        'only_new': len(only_new),
+        'added': 0,
+        'removed': 0,
+        'changed': 0
+    }
+    for result in files:
+        if 'error' in result:
+            summary['errors'] += 1
+            continue
+        differences = len(result['added']) + len(result['removed']) + len(result['changed'])
+        summary['with_differences' if differences else 'identical'] += 1
+        for kind in ('added', 'removed', 'changed'):
+            summary[kind] += len(result[kind])
+        changed_names.update(change['name'] for change in result['changed'])
+    summary['most_changed'] = changed_names.most_common(20)
+    summary['elapsed_s'] = time.perf_counter() - start
+
+    return {
+        'old_dir': old_dir,
+        'new_dir': new_dir,
+        'rel_tol': rel_tol,
+        'abs_tol': abs_tol,
+        'summary': summary,
+        'only_old': only_old,
+        'only_new': only_new,
+        'files': files
+    }
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def write_report(report, output_path):
+    """Write a diff report as JSON"""
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    return output_path
+
+def print_file_diff(result, max_lines=50):
+    """Print one file pair's differences"""
+    if 'error' in result:
+        print(f"❌ {result['old_path']} ↔ {result['new_path']}: {result['error']}")
+        return
+    differences = len(result['added']) + len(result['removed']) + len(result['changed'])
+    icon = "🔀" if differences else "✅"
+    print(f"{icon} {result['new_path']} (v{result['old_version']} → v{result['new_version']}): "
+          f"{len(result['changed'])} changed, {len(result['added'])} added, "
+          f"{len(result['removed'])} removed, {result['unchanged']} unchanged")
+
+    lines = [f"   ~ axis {c['axis_index']} {c['name']}: {c['old']} → {c['new']}" for c in result['changed']]
+    lines += [f"   + axis {a['axis_index']} {a['name']} = {a['value']}" for a in result['added']]
+    lines += [f"   - axis {r['axis_index']} {r['name']} = {r['value']}" for r in result['removed']]
+    for line in lines[:max_lines]:
+        print(line)
+    if len(lines) > max_lines:
+        print(f"   ... {len(lines) - max_lines} more")
+
+def print_summary(report):
+    """Print the directory diff summary"""
+    summary = report['summary']
+    print(f"\n📊 MCD diff: {summary['pairs']} pairs, {summary['with_differences']} with differences, "
+          f"{summary['identical']} identical, {summary['errors']} errors in {summary['elapsed_s']:.1f}s")
+    print(f"   Parameters: {summary['changed']} changed, {summary['added']} added, {summary['removed']} removed")
+    if summary['only_old'] or summary['only_new']:
+        print(f"   Unpaired: {summary['only_old']} only in {report['old_dir']}, "
+              f"{summary['only_new']} only in {report['new_dir']}")
+    for name, count in summary['most_changed'][:10]:
+        print(f"   ~ {name}: changed in {count} axes")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Diff MCD parameters between two files or directory trees")
+    parser.add_argument("old", help="Baseline MCD file or directory")
+    parser.add_argument("new", help="MCD file or directory to compare")
+    parser.add_argument("--json", dest="json_path", default=None, help="Write the full report as JSON")
+    parser.add_argument("--rel-tol", type=float, default=DEFAULT_REL_TOL)
+    parser.add_argument("--abs-tol", type=float, default=DEFAULT_ABS_TOL)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for directories (0 = none)")
+    parser.add_argument("--prefix", action="append", default=None,
+                        help="Only compare parameters starting with this prefix (repeatable)")
+    args = parser.parse_args()
+
+    groups = {prefix: prefix for prefix in args.prefix} if args.prefix else None
+    if os.path.isdir(args.old):
+        report = diff_directories(args.old, args.new, groups, args.rel_tol, args.abs_tol, args.workers)
+        for result in report['files']:
+            if 'error' in result or result['added'] or result['removed'] or result['changed']:
+                print_file_diff(result, max_lines=10)
+        print_summary(report)
+    else:
+        report = diff_mcd_files(args.old, args.new, groups, args.rel_tol, args.abs_tol)
+        print_file_diff(report)
+
+    if args.json_path:
+        write_report(report, args.json_path)
+        print(f"💾 Report written to {args.json_path}")
@@ -0,0 +1,353 @@
+"""
+McdService - Persistent MCD Generation Service
+==============================================
+
+Long-lived localhost HTTP service around AerotechController. The .NET runtime,
+Automation1 assemblies, drive_config.json and parsed templates are loaded once
+at startup and stay warm for every request.
+
+Requests from any number of concurrent clients are placed on an internal job
+queue and executed in order by a single executor thread that owns the
+controller (McdProcessor is not thread-safe).
+
+Endpoints (JSON bodies and responses):
+    POST /jobs          {"operation": ..., "params": {...}, "wait": true}
+                        → job result (wait=true) or {"job_id": ...} (wait=false)
+    GET  /jobs/<id>     → job status/result
+    GET  /health        → queue depth, job counters, template cache stats,
+                          drive config/template versions
+    POST /shutdown      → stop the service
+
+Operations: calculate_parameters, json_to_mcd, mcd_to_json, recalculate_and_extract.
+The GUI fallback is always disabled; MCD objects are saved per the service's
+file manager and their paths returned.
+
+With --reload-interval the service polls drive_config.json and the drive
+templates and swaps in new versions without restarting (no CLR reload).
+
+Usage:
+    python McdService.py --port 8765 --output-dir C:\\MCD_Output --reload-interval 2
+
+    client = McdServiceClient(port=8765)
+    result = client.calculate_parameters(specs_dict={...}, electrical_dict={...},
+                                         stage_type="ANT95L", axis="ST01", drive_type="iXA4")
+"""
+import os
+import sys
+import json
+import queue
+import uuid
+import threading
+import urllib.error
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from GenerateMCD_v2 import AerotechController
+
+sys.dont_write_bytecode = True
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# ============================================================================
+# JOB EXECUTION
+# ============================================================================
+
+class McdJobService:
+    """Job queue plus single executor thread around a warm AerotechController"""
+
+    OPERATIONS = ('calculate_parameters', 'json_to_mcd', 'mcd_to_json', 'recalculate_and_extract')
+
+    def __init__(self, mcd_processor, max_retained_jobs=1000):
+        """
+        Args:
+            mcd_processor (AerotechController): Controller to keep warm
+            max_retained_jobs (int): Finished jobs kept for GET /jobs/<id>
+        """
+        self.mcd_processor = mcd_processor
+        self.max_retained_jobs = max_retained_jobs
+        self._queue = queue.Queue()
+        self._jobs = OrderedDict()
+        self._jobs_lock = threading.Lock()
+        self._executor = None
+        self.counters = {'submitted': 0, 'succeeded': 0, 'failed': 0}
+
+    def start(self):
+        """Initialize the controller (warm the runtime) and start the executor thread"""
+        if not self.mcd_processor.get_processor().initialized:
+            self.mcd_processor.initialize()
+        self._executor = threading.Thread(target=self._run, name="McdJobExecutor", daemon=True)
+        self._executor.start()
+
+    def stop(self):
+        """Stop the executor after the jobs already queued"""
+        if self._executor:
+            self._queue.put(None)
+            self._executor.join()
+            self._executor = None
+
+    def submit(self, operation, params=None):
+        """
+        Queue a job
+
+        Args:
+            operation (str): One of OPERATIONS
+            params (dict): Keyword arguments for the controller method
+
+        Returns:
+            tuple: (job_id, Future resolving to the JSON-ready result dict)
+
+        Raises:
+            ValueError: If the operation is unknown
+        """
+        if operation not in self.OPERATIONS:
+            raise ValueError(f"Unknown operation '{operation}'. Supported: {', '.join(self.OPERATIONS)}")
+
+        job_id = uuid.uuid4().hex
+        future = Future()
+        with self._jobs_lock:
+            self._jobs[job_id] = {'job_id': job_id, 'operation': operation, 'status': 'queued', 'future': future}
+            self.counters['submitted'] += 1
+            # Evict the oldest finished jobs; queued/running ones are kept
+            excess = len(self._jobs) - self.max_retained_jobs
+            if excess > 0:
+                finished = [old_id for old_id, job in self._jobs.items() if job['future'].done()]
+                for old_id in finished[:excess]:
+                    del self._jobs[old_id]
+        self._queue.put((job_id, operation, dict(params or {}), future))
+        return job_id, future
+
+    def get_job(self, job_id):
+        """Get JSON-ready status for a job (None if unknown)"""
+        with self._jobs_lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        status = {'job_id': job_id, 'operation': job['operation'], 'status': job['status']}
+        if job['future'].done():
+            status.update(job['future'].result())
+        return status
+
+    def health(self):
+        """Get service status"""
+        with self._jobs_lock:
+            counters = dict(self.counters)
+        return {
+            'status': 'ok',
+            'queue_depth': self._queue.qsize(),
+            'jobs': counters,
+            'template_cache': self.mcd_processor.get_processor().get_template_cache_stats(),
+            **self.mcd_processor.get_config_versions()
+        }
+
+    def _run(self):
+        """Executor loop: run queued jobs one at a time on the warm controller"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            job_id, operation, params, future = item
+            self._set_status(job_id, 'running')
+            try:
+                result = {'ok': True, 'result': self._execute(operation, params)}
+                counter = 'succeeded'
+            except Exception as e:
+                result = {'ok': False, 'error': str(e), 'error_type': type(e).__name__}
+                counter = 'failed'
+            with self._jobs_lock:
+                self.counters[counter] += 1
+            self._set_status(job_id, 'done' if result['ok'] else 'failed')
+            future.set_result(result)
+
+    def _set_status(self, job_id, status):
+        with self._jobs_lock:
+            if job_id in self._jobs:
+                self._jobs[job_id]['status'] = status
+
+    def _execute(self, operation, params):
+        """Dispatch one operation and convert its result to JSON-ready data"""
+        if operation == 'calculate_parameters':
+            params['auto_configure_gui'] = False
+            _, warnings, calculated_path = self.mcd_processor.calculate_parameters(**params)
+            return {'calculated_path': calculated_path, 'warnings': warnings}
+
+        if operation == 'json_to_mcd':
+            params['auto_configure_gui'] = False
+            _, warnings, file_path = self.mcd_processor.json_to_mcd(**params)
+            return {'file_path': file_path, 'warnings': warnings}
+
+        if operation == 'mcd_to_json':
+            warnings = self.mcd_processor.mcd_to_json(**params)
+            return {'output_json_path': params.get('output_json_path'), 'warnings': warnings}
+
+        servo_params, ff_params, _, file_path, warnings = self.mcd_processor.recalculate_and_extract(**params)
+        return {
+            'servo_params': servo_params,
+            'feedforward_params': ff_params,
+            'file_path': file_path,
+            'warnings': warnings
+        }
+
+# ============================================================================
+# HTTP FRONT END
+# ============================================================================
+
+class _McdRequestHandler(BaseHTTPRequestHandler):
+    """Translate HTTP requests into McdJobService calls"""
+
+    # Set on the handler subclass built in McdServer
+    job_service = None
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json(200, self.job_service.health())
+        elif self.path.startswith('/jobs/'):
+            status = self.job_service.get_job(self.path[len('/jobs/'):])
+            if status is None:
+                self._send_json(404, {'error': 'Unknown job id'})
+            else:
+                self._send_json(200, status)
+        else:
+            self._send_json(404, {'error': f'Unknown endpoint: {self.path}'})
+
+    def do_POST(self):
+        if self.path == '/shutdown':
+            self._send_json(200, {'status': 'shutting down'})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return
+        if self.path != '/jobs':
+            self._send_json(404, {'error': f'Unknown endpoint: {self.path}'})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            if not isinstance(request, dict):
+                raise ValueError(f"Request body must be a JSON object, got {type(request).__name__}")
+            job_id, future = self.job_service.submit(request.get('operation'), request.get('params'))
+        except (ValueError, TypeError) as e:
+            self._send_json(400, {'error': str(e)})
+            return
+
+        if request.get('wait', True):
+            self._send_json(200, dict(future.result(), job_id=job_id))
+        else:
+            self._send_json(202, {'job_id': job_id, 'status': 'queued'})
+
+    def log_message(self, format, *args):
+        # Keep the console for job-level output
+        pass
+
+    def _send_json(self, status_code, payload):
+        body = json.dumps(payload, default=str).encode('utf-8')
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+class McdServer:
+    """Localhost HTTP server exposing a McdJobService"""
+
+    def __init__(self, mcd_processor=None, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """
+        Args:
+            mcd_processor (AerotechController, optional): Controller to serve
+                (default: AerotechController.with_default_config())
+            host (str): Bind address (keep on localhost - there is no authentication)
+            port (int): TCP port (0 picks a free port)
+        """
+        self.job_service = McdJobService(mcd_processor or AerotechController.with_default_config())
+        handler = type('McdRequestHandler', (_McdRequestHandler,), {'job_service': self.job_service})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+
+    @property
+    def address(self):
+        """(host, port) the server is bound to"""
+        return self.httpd.server_address
+
+    def serve_forever(self):
+        """Warm the runtime, then serve until /shutdown or KeyboardInterrupt"""
+        self.job_service.start()
+        host, port = self.address
+        print(f"🚀 MCD service listening on http://{host}:{port}")
+        try:
+            self.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.httpd.server_close()
+            self.job_service.stop()
+            print("🛑 MCD service stopped")
+
+# ============================================================================
+# CLIENT
+# ============================================================================
+
+class McdServiceClient:
+    """Minimal client for a running McdServer"""
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, timeout=600):
+        self.base_url = f"http://{host}:{port}"
+        self.timeout = timeout
+
+    def submit(self, operation, wait=True, **params):
+        """Submit a job; returns the result (wait=True) or {'job_id', 'status'}"""
+        return self._request('POST', '/jobs', {'operation': operation, 'params': params, 'wait': wait})
+
+    def calculate_parameters(self, **params):
+        return self.submit('calculate_parameters', **params)
+
+    def json_to_mcd(self, **params):
+        return self.submit('json_to_mcd', **params)
+
+    def mcd_to_json(self, mcd_path, output_json_path, compact=False):
+        return self.submit('mcd_to_json', mcd_path=mcd_path, output_json_path=output_json_path, compact=compact)
+
+    def recalculate_and_extract(self, mcd_path, save_recalculated=None):
+        return self.submit('recalculate_and_extract', mcd_path=mcd_path, save_recalculated=save_recalculated)
+
+    def get_job(self, job_id):
+        return self._request('GET', f'/jobs/{job_id}')
+
+    def health(self):
+        return self._request('GET', '/health')
+
+    def shutdown(self):
+        return self._request('POST', '/shutdown', {})
+
+    def _request(self, method, path, payload=None):
+        data = json.dumps(payload).encode('utf-8') if payload is not None else None
+        request = urllib.request.Request(
+            self.base_url + path, data=data, method=method,
+            headers={'Content-Type': 'application/json'}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return json.loads(e.read())
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Persistent MCD generation service")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--output-dir", default=None, help="Directory for saved MCD files (default: working dir)")
+    parser.add_argument("--reload-interval", type=float, default=None,
+                        help="Hot-reload drive_config.json and templates, polling every N seconds")
+    args = parser.parse_args()
+
+    if args.output_dir:
+        mcd_processor = AerotechController.with_file_saving(output_dir=os.path.abspath(args.output_dir))
+    else:
+        mcd_processor = AerotechController.with_default_config()
+
+    if args.reload_interval:
+        mcd_processor.start_hot_reload(args.reload_interval)
+
+    McdServer(mcd_processor, args.host, args.port).serve_forever()